@@ -5,6 +5,8 @@ Extracts common patterns from server.py to reduce duplication.
 All helpers preserve exact existing behavior.
 """
 
+import asyncio
+import contextvars
 import functools
 import inspect
 import logging
@@ -30,8 +32,9 @@ TOOL_ANNOTATIONS = ToolAnnotations(
 def stringify_id(*values: Optional[Union[str, int]]) -> tuple:
     """Convert id/mst/jo values to strings if they are integers.
     LLMs may extract numbers as ints from XML, but API params expect strings.
+    Strings (the common case, incl. zero-padded "000300") pass through as-is.
     """
-    return tuple(str(v) if v is not None else None for v in values)
+    return tuple([v if v is None or isinstance(v, str) else str(v) for v in values])
 
 
 class ToolValidationError(ValueError):
@@ -52,20 +55,20 @@ def handle_tool_error(func):
             try:
                 return await func(*args, **kwargs)
             except ToolValidationError as e:
-                logger.warning(f"Validation error in {func.__name__}: {e}")
+                logger.warning("Validation error in %s: %s", func.__name__, e)
                 return create_error_response(
                     error_code=ErrorCode.VALIDATION_ERROR,
                     message=str(e),
                     hints=e.hints,
                 )
             except ValueError as e:
-                logger.warning(f"Validation error in {func.__name__}: {e}")
+                logger.warning("Validation error in %s: %s", func.__name__, e)
                 return create_error_response(
                     error_code=ErrorCode.VALIDATION_ERROR,
                     message=str(e),
                 )
             except Exception as e:
-                logger.exception(f"Unexpected error in {func.__name__}: {e}")
+                logger.exception("Unexpected error in %s: %s", func.__name__, e)
                 return create_error_response(
                     error_code=ErrorCode.INTERNAL_ERROR,
                     message=f"Unexpected error: {str(e)}",
@@ -77,20 +80,20 @@ def handle_tool_error(func):
             try:
                 return func(*args, **kwargs)
             except ToolValidationError as e:
-                logger.warning(f"Validation error in {func.__name__}: {e}")
+                logger.warning("Validation error in %s: %s", func.__name__, e)
                 return create_error_response(
                     error_code=ErrorCode.VALIDATION_ERROR,
                     message=str(e),
                     hints=e.hints,
                 )
             except ValueError as e:
-                logger.warning(f"Validation error in {func.__name__}: {e}")
+                logger.warning("Validation error in %s: %s", func.__name__, e)
                 return create_error_response(
                     error_code=ErrorCode.VALIDATION_ERROR,
                     message=str(e),
                 )
             except Exception as e:
-                logger.exception(f"Unexpected error in {func.__name__}: {e}")
+                logger.exception("Unexpected error in %s: %s", func.__name__, e)
                 return create_error_response(
                     error_code=ErrorCode.INTERNAL_ERROR,
                     message=f"Unexpected error: {str(e)}",
@@ -98,6 +101,48 @@ def handle_tool_error(func):
         return sync_wrapper
 
 
+# Event loop serving the current tool call; asyncio.to_thread copies the
+# context into the worker thread, so sync tool bodies can reach it there
+_tool_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = contextvars.ContextVar(
+    "_tool_loop", default=None
+)
+
+
+def run_in_thread(func):
+    """Wrap a sync tool function as async, running it in a worker thread.
+    FastMCP calls sync tools directly on the event loop, so a slow law.go.kr
+    request would stall every other session. Async functions pass through.
+    """
+    if inspect.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    async def thread_wrapper(*args, **kwargs):
+        _tool_loop.set(asyncio.get_running_loop())
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return thread_wrapper
+
+
+def run_coroutine(coro):
+    """Run a coroutine to completion from a sync tool body.
+    Inside run_in_thread it runs on the server's event loop (where shared async
+    clients such as the citation extractor live) while this thread waits;
+    outside a server it gets a fresh loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_coroutine() would block the running event loop; await instead")
+
+    loop = _tool_loop.get()
+    if loop is None:
+        return asyncio.run(coro)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
 def slim_response(response: dict) -> dict:
     """Remove redundant raw XML when parsed data exists.
     When SLIM_RESPONSE=true, removes 'raw_content' only if 'ranked_data' exists.
@@ -111,6 +156,7 @@ def slim_response(response: dict) -> dict:
 
 
 from .params import map_params_to_upstream
+from .validation import validate_pagination
 from .parser import parse_xml_response, extract_law_list, update_law_list, extract_items_list, update_items_list
 from .cache import get_cache
 from .resolver import get_resolver
@@ -136,12 +182,15 @@ def run_search(
     Handles: law name resolution, caching, param mapping, API call, XML/JSON parsing,
     relevance ranking (3 pipelines), alias learning, trimming, slim_response.
     """
+    # Reject out-of-range pagination locally instead of spending a round-trip
+    validate_pagination(display, snake_params.get("page", 1))
+
     # Resolve law name aliases (e.g., "자통법" → "자본시장과 금융투자업에 관한 법률")
     resolver = get_resolver()
     resolved_query = resolver.resolve(query)
     if resolved_query != query:
         snake_params["query"] = resolved_query
-        logger.info(f"Resolved query: '{query}' → '{resolved_query}'")
+        logger.info("Resolved query: '%s' → '%s'", query, resolved_query)
 
     upstream_params = map_params_to_upstream(snake_params)
 
@@ -158,18 +207,19 @@ def run_search(
         # JSON format ignores numOfRows — must also set display for JSON over-fetch
         if response_type == "JSON":
             upstream_params["display"] = "100"
-        logger.debug(f"Ranking enabled: fetching 100 results instead of {original_display}")
+        logger.debug("Ranking enabled: fetching 100 results instead of %s", original_display)
 
     # Check cache before making API call
     cache = get_cache()
-    cached = cache.get(target, upstream_params)
-    if cached is not None:
-        response = cached
-    else:
+    cached = cache.get(target, upstream_params, response_type)
+    if cached is None:
         client = get_client()
-        response = client.get("/DRF/lawSearch.do", upstream_params, response_type)
+        cached = client.get("/DRF/lawSearch.do", upstream_params, response_type)
         # Cache the raw response
-        cache.put(target, upstream_params, response)
+        cache.put(target, upstream_params, response_type, cached)
+    # The cached dict is shared by concurrent tool calls (and by callers with a
+    # different display, since over-fetch normalizes it): annotate a copy only
+    response = dict(cached)
 
     if response.get("status") == "ok" and response_type in ("XML", "JSON"):
         raw_content = response.get("raw_content", "")
@@ -202,7 +252,7 @@ def run_search(
 
                         if len(ranked_items) > original_display:
                             ranked_items = ranked_items[:original_display]
-                            logger.debug(f"Trimmed results from {len(items)} to {original_display}")
+                            logger.debug("Trimmed results from %d to %s", len(items), original_display)
 
                         if list_type == "law":
                             parsed_data = update_law_list(parsed_data, ranked_items)
@@ -250,15 +300,17 @@ def run_service(
     # Check cache (only for full responses — summary mode always fetches fresh then strips)
     cache = get_cache()
     if sections != "summary":
-        cached = cache.get(target, upstream_params)
+        cached = cache.get(target, upstream_params, response_type)
         if cached is not None:
-            return cached
+            # Hand out a copy: the cached dict is shared by concurrent tool calls
+            return dict(cached)
 
     client = get_client()
     response = client.get("/DRF/lawService.do", upstream_params, response_type)
 
-    # Cache the full response before section filtering
-    cache.put(target, upstream_params, response)
+    # Cache the full response before section filtering; the filtering below
+    # edits `response`, so the cache keeps its own copy
+    cache.put(target, upstream_params, response_type, dict(response))
 
     # Section filtering: strip full-text fields when sections="summary"
     if sections == "summary" and full_text_fields and response.get("status") == "ok":
@@ -10,6 +10,7 @@ Features:
 
 import hashlib
 import logging
+import threading
 import time
 from collections import OrderedDict
 from typing import Optional
@@ -66,19 +67,21 @@ def _normalize_query(query: str) -> str:
     return q
 
 
-def _make_cache_key(target: str, params: dict) -> str:
-    """Create a stable cache key from target + params.
+def _make_cache_key(target: str, params: dict, response_type: str) -> str:
+    """Create a stable cache key from target + response type + params.
 
-    Normalizes query strings and sorts params for consistent keys.
+    Normalizes query strings and sorts params for consistent keys. The
+    response type is part of the key: XML and JSON bodies for the same
+    query are different responses.
     """
     # Extract and normalize query
     query = _normalize_query(params.get("query", params.get("QUERY", "")))
 
-    # Build key parts: target + sorted non-empty params
-    key_parts = [f"t={target}", f"q={query}"]
+    # Build key parts: target + response type + sorted non-empty params
+    key_parts = [f"t={target}", f"r={response_type}", f"q={query}"]
     for k in sorted(params.keys()):
         if k.lower() in ("oc", "type", "query"):
-            continue  # Skip auth, format, and already-handled query
+            continue  # Skip auth, format (keyed above), and already-handled query
         v = params[k]
         if v is not None and str(v).strip():
             key_parts.append(f"{k}={v}")
@@ -95,43 +98,47 @@ class ResponseCache:
         self._max_entries = max_entries
         self._hits = 0
         self._misses = 0
+        # Sync tools run in worker threads; guard the lookup+reorder sequences
+        self._lock = threading.Lock()
 
-    def get(self, target: str, params: dict) -> Optional[dict]:
+    def get(self, target: str, params: dict, response_type: str) -> Optional[dict]:
         """Look up cached response. Returns None on miss or expiry."""
-        key = _make_cache_key(target, params)
-
-        if key not in self._cache:
-            self._misses += 1
-            return None
-
-        timestamp, response = self._cache[key]
+        key = _make_cache_key(target, params, response_type)
         ttl = self._get_ttl(target)
 
-        if time.time() - timestamp > ttl:
-            # Expired
-            del self._cache[key]
-            self._misses += 1
-            return None
-
-        # Hit — move to end (most recently used)
-        self._cache.move_to_end(key)
-        self._hits += 1
-        logger.debug(f"Cache HIT: {target} (key={key[:8]})")
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            timestamp, response = entry
+            if time.time() - timestamp > ttl:
+                # Expired
+                del self._cache[key]
+                self._misses += 1
+                return None
+
+            # Hit — move to end (most recently used)
+            self._cache.move_to_end(key)
+            self._hits += 1
+        logger.debug("Cache HIT: %s (key=%.8s)", target, key)
         return response
 
-    def put(self, target: str, params: dict, response: dict) -> None:
+    def put(self, target: str, params: dict, response_type: str, response: dict) -> None:
         """Store a response in cache. Only caches successful responses."""
         if response.get("status") != "ok":
             return  # Don't cache errors
 
-        key = _make_cache_key(target, params)
+        key = _make_cache_key(target, params, response_type)
 
-        # Evict oldest if at capacity
-        while len(self._cache) >= self._max_entries:
-            self._cache.popitem(last=False)
+        with self._lock:
+            # Evict oldest if at capacity
+            while len(self._cache) >= self._max_entries:
+                self._cache.popitem(last=False)
 
-        self._cache[key] = (time.time(), response)
-        logger.debug(f"Cache PUT: {target} (key={key[:8]})")
+            self._cache[key] = (time.time(), response)
+        logger.debug("Cache PUT: %s (key=%.8s)", target, key)
 
     def invalidate(self, target: str = None) -> int:
         """Clear cache entries. If target given, only clear that target's entries."""
@@ -10,20 +10,192 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
+import os
 import re
+import sys
+import tempfile
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+from html import unescape
+from pathlib import Path
 from urllib.parse import quote
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 multiplexing in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
-@dataclass
+# Sentinel for "use default_lsi_seq_cache_path()" (None disables persistence)
+_DEFAULT_CACHE_PATH: Any = object()
+
+
+def default_lsi_seq_cache_path() -> Optional[Path]:
+    """
+    On-disk MST -> lsiSeq mapping, persisted across restarts.
+
+    Resolved when an extractor is created rather than at import, so a missing
+    HOME (common in containers) only disables persistence instead of failing
+    the import. LEXLINK_CACHE_DIR may use "~" (as in .env.example).
+    """
+    try:
+        cache_dir = os.getenv("LEXLINK_CACHE_DIR")
+        if cache_dir:
+            return Path(cache_dir).expanduser() / "lsi_seq.json"
+        return Path.home() / ".cache" / "lexlink" / "lsi_seq.json"
+    except RuntimeError as e:  # home directory cannot be determined
+        logger.warning("lsiSeq cache disabled: %s", e)
+        return None
+
+# Prefer the C-backed lxml parser (much faster than html.parser); fall back if missing
+try:
+    BeautifulSoup("", "lxml")
+    _HTML_PARSER = "lxml"
+except FeatureNotFound:
+    logger.debug("lxml not installed; falling back to html.parser for citation parsing")
+    _HTML_PARSER = "html.parser"
+
+# Only build DOM nodes for citation anchors (<a class="sfonN link ...">)
+_STRAINER = SoupStrainer('a', class_=re.compile(r'(?=.*\blink\b)(?=.*\bsfon)'))
+
+# Citation text patterns
+_ARTICLE_RE = re.compile(r'제(\d+)조(?:의(\d+))?')
+_PARAGRAPH_RE = re.compile(r'제(\d+)항')
+_ITEM_RE = re.compile(r'제(\d+)호')
+_LAW_NAME_RE = re.compile(r'「([^」]+)」')
+_FNCPOP_RE = re.compile(r"fncLsLawPop\s*\(\s*['\"](\d+)['\"].*?['\"](\w+)['\"]")
+_LSI_SEQ_RE = re.compile(r'lsiSeq=(\d+)')
+
+# All four link-text shapes fused into one pattern, so each link runs a single search
+_LINK_TEXT_RE = re.compile(
+    r'「(?P<law>[^」]+)」'
+    r'|제(?P<art>\d+)조(?:의(?P<art_br>\d+))?'
+    r'|제(?P<para>\d+)항'
+    r'|제(?P<item>\d+)호'
+)
+
+# Regex scan over law.go.kr's machine-generated anchors: (attributes, inner HTML)
+_ANCHOR_RE = re.compile(r'<a\b([^>]*)>(.*?)</a\s*>', re.DOTALL | re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(r'\bclass\s*=\s*"([^"]*)"', re.IGNORECASE)
+_ONCLICK_ATTR_RE = re.compile(r'\bonclick\s*=\s*"([^"]*)"', re.IGNORECASE)
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_tags(fragment: str) -> str:
+    """Extract text from an HTML fragment (equivalent to get_text(strip=True))."""
+    if '<' in fragment:
+        # Strip each text run like get_text(strip=True), so "「 <span>형법</span> 」" → "「형법」"
+        fragment = "".join(part.strip() for part in _TAG_STRIP_RE.split(fragment))
+    else:
+        fragment = fragment.strip()
+    if '&' in fragment:
+        fragment = unescape(fragment).strip()
+    return fragment
+
+
+def _parse_fncpop(onclick: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract (ref_id, ref_type) from onclick="fncLsLawPop('123','JO','')".
+
+    Uses str.find for the canonical form and falls back to the regex for
+    unusual spacing/quoting.
+    """
+    i = onclick.find("fncLsLawPop(")
+    if i >= 0:
+        quote_char = onclick[i + 12:i + 13]
+        if quote_char == "'" or quote_char == '"':
+            start = i + 13
+            end = onclick.find(quote_char, start)
+            ref_id = onclick[start:end]
+            if end > start and ref_id.isascii() and ref_id.isdigit():
+                type_quote = onclick[end + 2:end + 3]
+                if onclick[end + 1:end + 2] == "," and (type_quote == "'" or type_quote == '"'):
+                    type_start = end + 3
+                    type_end = onclick.find(type_quote, type_start)
+                    ref_type = onclick[type_start:type_end]
+                    if type_end > type_start and ref_type.replace("_", "").isalnum():
+                        return ref_id, ref_type
+    elif "fncLsLawPop" not in onclick:
+        return None
+
+    match = _FNCPOP_RE.search(onclick)
+    return (match.group(1), match.group(2)) if match else None
+
+
+def _find_lsi_seq(html: str) -> Optional[str]:
+    """Return the digits following the first 'lsiSeq=' occurrence that has any."""
+    n = len(html)
+    i = html.find("lsiSeq=")
+    while i >= 0:
+        start = end = i + 7
+        while end < n and "0" <= html[end] <= "9":
+            end += 1
+        if end > start:
+            return html[start:end]
+        i = html.find("lsiSeq=", start)
+    return None
+
+
+def _article_display(article: int, article_branch: int = 0) -> str:
+    """Format an article for display: "제3조" or "제37조의2"."""
+    if article_branch > 0:
+        return f"제{article}조의{article_branch}"
+    return f"제{article}조"
+
+
+def _error_result(mst: str, law_name: str, article_display: str, message: str) -> Dict[str, Any]:
+    """Build a failed extraction result in its final dict shape (see CitationResult.to_dict)."""
+    return {
+        "success": False,
+        "law_id": mst,
+        "law_name": law_name,
+        "article": article_display,
+        "citation_count": 0,
+        "citations": [],
+        "internal_count": 0,
+        "external_count": 0,
+        "extraction_method": "html",
+        "processing_time_ms": 0.0,
+        "errors": [message],
+    }
+
+
+class _RateLimiter:
+    """
+    Minimal async rate limiter (leaky bucket).
+
+    Each acquire reserves the next free slot, spaced `interval` seconds
+    apart. An idle limiter lets the first request through immediately;
+    concurrent callers are spread out instead of all sleeping and then
+    bursting together.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@dataclass(slots=True)
 class Citation:
     """Structured citation data extracted from HTML."""
 
@@ -52,23 +224,21 @@ class Citation:
             "ref_id": self.target_ref_id,
         }
 
-        if self.target_law_name:
-            result["target_law_name"] = self.target_law_name
-        if self.target_article is not None:
-            result["target_article"] = self.target_article
-        if self.target_article_branch is not None:
-            result["target_article_branch"] = self.target_article_branch
-        if self.target_paragraph is not None:
-            result["target_paragraph"] = self.target_paragraph
-        if self.target_item is not None:
-            result["target_item"] = self.target_item
-        if self.target_subitem:
-            result["target_subitem"] = self.target_subitem
+        # Optional target fields: omit None and empty strings (0 is kept)
+        optional = (
+            ("target_law_name", self.target_law_name),
+            ("target_article", self.target_article),
+            ("target_article_branch", self.target_article_branch),
+            ("target_paragraph", self.target_paragraph),
+            ("target_item", self.target_item),
+            ("target_subitem", self.target_subitem),
+        )
+        result.update({k: v for k, v in optional if v is not None and v != ""})
 
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationResult:
     """Result of citation extraction for an article."""
 
@@ -123,25 +293,107 @@ class CitationExtractor:
     ARTICLE_HTML_URL = "https://www.law.go.kr/LSW/lsSideInfoP.do"
     LAW_PAGE_URL = "https://www.law.go.kr/법령/{law_name}"
 
-    # Regex patterns
-    ARTICLE_PATTERN = re.compile(r'제(\d+)조(?:의(\d+))?')
-    PARAGRAPH_PATTERN = re.compile(r'제(\d+)항')
-    ITEM_PATTERN = re.compile(r'제(\d+)호')
-    LAW_NAME_PATTERN = re.compile(r'「([^」]+)」')
-    FNCPOP_PATTERN = re.compile(r"fncLsLawPop\s*\(\s*['\"](\d+)['\"].*?['\"](\w+)['\"]")
-    LSI_SEQ_PATTERN = re.compile(r'lsiSeq=(\d+)')
+    # Regex patterns (aliases of the module-level constants)
+    ARTICLE_PATTERN = _ARTICLE_RE
+    PARAGRAPH_PATTERN = _PARAGRAPH_RE
+    ITEM_PATTERN = _ITEM_RE
+    LAW_NAME_PATTERN = _LAW_NAME_RE
+    FNCPOP_PATTERN = _FNCPOP_RE
+    LSI_SEQ_PATTERN = _LSI_SEQ_RE
 
-    def __init__(self, timeout: int = 15, request_delay: float = 0.1):
+    def __init__(
+        self,
+        timeout: int = 15,
+        request_delay: float = 0.1,
+        result_cache_size: int = 256,
+        result_cache_ttl: float = 3600.0,
+        max_concurrency: int = 8,
+        lsi_seq_cache_path: Optional[Path] = _DEFAULT_CACHE_PATH,
+    ):
         """
         Initialize citation extractor.
 
         Args:
             timeout: HTTP request timeout in seconds
-            request_delay: Delay between requests to avoid rate limiting
+            request_delay: Minimum spacing between article fetches (rate limit)
+            result_cache_size: Max number of cached extraction results (LRU)
+            result_cache_ttl: Seconds a cached extraction result stays valid
+            max_concurrency: Max in-flight article fetches (politeness cap for batches)
+            lsi_seq_cache_path: JSON file persisting MST -> lsiSeq (None disables;
+                defaults to default_lsi_seq_cache_path())
         """
         self.timeout = timeout
         self.request_delay = request_delay
         self._lsi_seq_cache: Dict[str, str] = {}  # MST -> lsiSeq mapping
+        if lsi_seq_cache_path is _DEFAULT_CACHE_PATH:
+            lsi_seq_cache_path = default_lsi_seq_cache_path()
+        self._lsi_seq_cache_path = lsi_seq_cache_path
+        self._lsi_seq_cache_lock = asyncio.Lock()
+        self._load_lsi_seq_cache()
+
+        # (mst, law_name, article, article_branch) -> (monotonic timestamp, result)
+        self._result_cache: "OrderedDict[Tuple[str, str, int, int], Tuple[float, CitationResult]]" = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._result_cache_ttl = result_cache_ttl
+
+        # Caps concurrent article fetches issued by extract_citations_batch
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrency)
+        # Spaces fetches request_delay apart without delaying an idle single request
+        self._limiter = _RateLimiter(request_delay)
+
+        # (lsiSeq, article, branch) -> (ETag, Last-Modified, HTML) for conditional GETs
+        self._article_validators: "OrderedDict[Tuple[str, int, int], Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+
+        # Shared pooled client: reuses TCP/TLS connections across fetches
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=_HTTP2_AVAILABLE,
+            follow_redirects=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client (call at shutdown)."""
+        await self._client.aclose()
+
+    def _load_lsi_seq_cache(self) -> None:
+        """Load the persisted lsiSeq mapping (missing or corrupt file is ignored)."""
+        if self._lsi_seq_cache_path is None:
+            return
+        try:
+            with open(self._lsi_seq_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._lsi_seq_cache.update(
+                    {str(k): str(v) for k, v in data.items()}
+                )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not load lsiSeq cache: %s", e)
+
+    def _write_lsi_seq_cache(self, snapshot: Dict[str, str]) -> None:
+        """Atomically write the lsiSeq mapping (tempfile + rename)."""
+        path = self._lsi_seq_cache_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".lsi_seq.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    async def _save_lsi_seq_cache(self) -> None:
+        """Persist the lsiSeq mapping off the event loop."""
+        if self._lsi_seq_cache_path is None:
+            return
+        async with self._lsi_seq_cache_lock:
+            try:
+                await asyncio.to_thread(self._write_lsi_seq_cache, dict(self._lsi_seq_cache))
+            except Exception as e:
+                logger.warning("Could not save lsiSeq cache: %s", e)
 
     async def get_lsi_seq(self, law_name: str, mst: str) -> Optional[str]:
         """
@@ -166,28 +418,27 @@ class CitationExtractor:
         url = f"https://www.law.go.kr/법령/{encoded_name}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, follow_redirects=True)
+            response = await self._client.get(url)
 
-                if response.status_code != 200:
-                    logger.warning(f"Failed to fetch law page: {response.status_code}")
-                    return None
+            if response.status_code != 200:
+                logger.warning("Failed to fetch law page: %s", response.status_code)
+                return None
 
-                html = response.text
+            html = response.text
 
-                # Look for lsiSeq in iframe src or script tags
-                match = self.LSI_SEQ_PATTERN.search(html)
-                if match:
-                    lsi_seq = match.group(1)
-                    self._lsi_seq_cache[mst] = lsi_seq
-                    logger.debug(f"Found lsiSeq={lsi_seq} for MST={mst}")
-                    return lsi_seq
+            # Look for lsiSeq in iframe src or script tags
+            lsi_seq = _find_lsi_seq(html)
+            if lsi_seq:
+                self._lsi_seq_cache[mst] = lsi_seq
+                logger.debug("Found lsiSeq=%s for MST=%s", lsi_seq, mst)
+                await self._save_lsi_seq_cache()
+                return lsi_seq
 
-                logger.warning(f"Could not find lsiSeq for {law_name}")
-                return None
+            logger.warning("Could not find lsiSeq for %s", law_name)
+            return None
 
         except Exception as e:
-            logger.error(f"Error fetching law page: {e}")
+            logger.error("Error fetching law page: %s", e)
             return None
 
     async def fetch_article_html(
@@ -215,26 +466,48 @@ class CitationExtractor:
             "urlMode": "lsScJoRltInfoR"
         }
 
-        try:
-            await asyncio.sleep(self.request_delay)
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.ARTICLE_HTML_URL, params=params)
+        # Revalidate previously fetched HTML instead of downloading it again
+        key = (lsi_seq, article_no, article_branch)
+        validators = self._article_validators.get(key)
+        headers = {}
+        if validators:
+            etag, last_modified, _ = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
-                if response.status_code == 200:
-                    return response.text
-                else:
-                    logger.debug(f"Article fetch returned {response.status_code}")
-                    return None
+        try:
+            async with self._fetch_semaphore, self._limiter:
+                response = await self._client.get(
+                    self.ARTICLE_HTML_URL, params=params, headers=headers
+                )
+
+            if response.status_code == 304 and validators:
+                self._article_validators.move_to_end(key)
+                return validators[2]
+            elif response.status_code == 200:
+                html = response.text
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                if etag or last_modified:
+                    while len(self._article_validators) >= self._result_cache_size:
+                        self._article_validators.popitem(last=False)
+                    self._article_validators[key] = (etag, last_modified, html)
+                return html
+            else:
+                logger.debug("Article fetch returned %s", response.status_code)
+                return None
 
         except Exception as e:
-            logger.error(f"Error fetching article HTML: {e}")
+            logger.error("Error fetching article HTML: %s", e)
             return None
 
     def parse_citations(
         self,
         html: str,
-        source_law_name: str
+        source_law_name: str,
+        use_regex: bool = True
     ) -> List[Citation]:
         """
         Parse citation links from article HTML.
@@ -242,50 +515,92 @@ class CitationExtractor:
         Args:
             html: Article HTML content
             source_law_name: Name of the source law (for internal/external classification)
+            use_regex: Scan anchors with a compiled regex (fast path). Set False
+                       to fall back to BeautifulSoup DOM parsing.
 
         Returns:
             List of parsed citations (not yet consolidated)
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        citations = []
+        if use_regex:
+            return self._parse_citations_regex(html, source_law_name)
 
-        # Find all citation links (class contains "link" and "sfon")
-        link_elements = soup.find_all(
-            'a',
-            class_=lambda x: x and 'link' in x and 'sfon' in x
-        )
+        # Strainer already restricts the tree to citation links
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_STRAINER)
+        citations = []
 
-        for link in link_elements:
+        for link in soup.find_all('a'):
             citation = self._parse_single_link(link, source_law_name)
             if citation:
                 citations.append(citation)
 
         return citations
 
+    def _parse_citations_regex(
+        self,
+        html: str,
+        source_law_name: str
+    ) -> List[Citation]:
+        """Parse citation links with a single regex pass (no DOM construction)."""
+        citations = []
+
+        # Bind hot-loop lookups to locals
+        append = citations.append
+        build = self._build_citation
+        class_search = _CLASS_ATTR_RE.search
+        onclick_search = _ONCLICK_ATTR_RE.search
+
+        for anchor in _ANCHOR_RE.finditer(html):
+            attrs = anchor.group(1)
+            if 'sfon' not in attrs:
+                continue
+
+            class_match = class_search(attrs)
+            if not class_match:
+                continue
+            classes = class_match.group(1).split()
+            if 'link' not in classes:
+                continue
+
+            onclick_match = onclick_search(attrs)
+            onclick = unescape(onclick_match.group(1)) if onclick_match else ''
+
+            citation = build(onclick, _strip_tags(anchor.group(2)), classes, source_law_name)
+            if citation:
+                append(citation)
+
+        return citations
+
     def _parse_single_link(
         self,
         link,
         source_law_name: str
     ) -> Optional[Citation]:
         """Parse a single citation link element."""
-        onclick = link.get('onclick', '')
-        link_text = link.get_text(strip=True)
-        classes = link.get('class', [])
+        attrs = link.attrs  # Read attributes once instead of via Tag.get()
+        return self._build_citation(
+            attrs.get('onclick', ''),
+            "".join(link.stripped_strings),
+            attrs.get('class', ()),
+            source_law_name,
+        )
 
+    def _build_citation(
+        self,
+        onclick: str,
+        link_text: str,
+        classes: Sequence[str],
+        source_law_name: str
+    ) -> Optional[Citation]:
+        """Build a citation from a link's onclick handler, text, and CSS classes."""
         # Extract ref_id and type from onclick="fncLsLawPop('123','JO','')"
-        match = self.FNCPOP_PATTERN.search(onclick)
-        if not match:
+        parsed = _parse_fncpop(onclick)
+        if not parsed:
             return None
 
-        ref_id = match.group(1)
-        ref_type = match.group(2)
+        ref_id, ref_type = parsed
 
         # Determine link class (sfon1, sfon2, sfon3, sfon4)
-        link_class = ""
-        for cls in classes:
-            if cls.startswith('sfon'):
-                link_class = cls
-                break
+        link_class = next((cls for cls in classes if cls[:4] == 'sfon'), "")
 
         citation = Citation(
             target_text=link_text,
@@ -294,42 +609,65 @@ class CitationExtractor:
             link_class=link_class
         )
 
-        # Parse target details based on link class
+        # Parse target details based on link class. One fused search covers the
+        # common case; if the first hit is a different shape than this class
+        # expects (e.g. 제N항 before 제N조), fall back to the dedicated pattern.
+        if link_class not in ('sfon1', 'sfon2', 'sfon3', 'sfon4'):
+            return citation
+        text_match = _LINK_TEXT_RE.search(link_text)
+
         if link_class == 'sfon1':
-            # Law name: 「법명」
-            law_match = self.LAW_NAME_PATTERN.search(link_text)
-            if law_match:
-                citation.target_law_name = law_match.group(1)
+            # Law name: 「법명」 (interned so the consolidator's name
+            # comparisons short-circuit on identity)
+            law_name = text_match and text_match.group('law')
+            if law_name is None and text_match is not None:
+                law_match = _LAW_NAME_RE.search(link_text)
+                law_name = law_match.group(1) if law_match else None
+            if law_name:
+                citation.target_law_name = sys.intern(law_name)
                 citation.citation_type = "external"
             elif '같은 법' in link_text or '이 법' in link_text:
                 citation.citation_type = "internal"
                 citation.target_law_name = source_law_name
             else:
-                citation.target_law_name = link_text
+                citation.target_law_name = sys.intern(link_text)
                 citation.citation_type = "external"
 
         elif link_class == 'sfon2':
             # Article: 제N조 or 제N조의M
             citation.citation_type = "internal"
-            art_match = self.ARTICLE_PATTERN.search(link_text)
-            if art_match:
-                citation.target_article = int(art_match.group(1))
-                if art_match.group(2):
-                    citation.target_article_branch = int(art_match.group(2))
+            if text_match is not None:
+                article, branch = text_match.group('art', 'art_br')
+                if article is None:
+                    art_match = _ARTICLE_RE.search(link_text)
+                    if art_match:
+                        article, branch = art_match.groups()
+                if article is not None:
+                    citation.target_article = int(article)
+                    if branch:
+                        citation.target_article_branch = int(branch)
 
         elif link_class == 'sfon3':
             # Paragraph: 제N항
             citation.citation_type = "internal"
-            para_match = self.PARAGRAPH_PATTERN.search(link_text)
-            if para_match:
-                citation.target_paragraph = int(para_match.group(1))
-
-        elif link_class == 'sfon4':
-            # Item: 제N호
+            if text_match is not None:
+                paragraph = text_match.group('para')
+                if paragraph is None:
+                    para_match = _PARAGRAPH_RE.search(link_text)
+                    paragraph = para_match.group(1) if para_match else None
+                if paragraph is not None:
+                    citation.target_paragraph = int(paragraph)
+
+        else:
+            # Item: 제N호 (sfon4)
             citation.citation_type = "internal"
-            item_match = self.ITEM_PATTERN.search(link_text)
-            if item_match:
-                citation.target_item = int(item_match.group(1))
+            if text_match is not None:
+                item = text_match.group('item')
+                if item is None:
+                    item_match = _ITEM_RE.search(link_text)
+                    item = item_match.group(1) if item_match else None
+                if item is not None:
+                    citation.target_item = int(item)
 
         return citation
 
@@ -351,55 +689,70 @@ class CitationExtractor:
         if not citations:
             return []
 
-        consolidated = []
+        # Each input link yields at most one output citation, so preallocate
+        # and fill by index instead of growing the list with append()
+        consolidated: List[Optional[Citation]] = [None] * len(citations)
+        idx = 0
+
+        # Merged link texts are collected per citation and joined once at the end
+        text_parts: Dict[int, List[str]] = {}
+
+        def merge_text(target: Citation, text: str) -> None:
+            parts = text_parts.get(id(target))
+            if parts is None:
+                text_parts[id(target)] = [target.target_text, text]
+            else:
+                parts.append(text)
+
+        last = None                    # Most recently emitted citation
+        last_internal_article = None   # Last internal article citation (sfon2)
         current_external_law = None
-        current_internal_article_idx = None  # Index of last internal article citation
 
         for citation in citations:
-            if citation.link_class == 'sfon1':
+            link_class = citation.link_class
+
+            if link_class == 'sfon1':
                 # New law reference - resets internal article tracking
-                current_internal_article_idx = None
+                last_internal_article = None
                 if citation.citation_type == "external":
                     current_external_law = citation.target_law_name
                 else:
                     current_external_law = None
-                consolidated.append(citation)
-
-            elif citation.link_class == 'sfon2':
-                # Article reference
-                if current_external_law and len(consolidated) > 0:
-                    last = consolidated[-1]
-                    if (last.citation_type == "external" and
-                        last.target_law_name == current_external_law):
-                        # Check if external law already has an article
-                        if last.target_article is None:
-                            # Merge article into external law citation
-                            last.target_article = citation.target_article
-                            last.target_article_branch = citation.target_article_branch
-                            last.target_text += " " + citation.target_text
-                            current_internal_article_idx = None
-                            continue
-                        # Else: external law already has article, treat as new internal
+                consolidated[idx] = citation
+                idx += 1
+                last = citation
+
+            elif link_class == 'sfon2':
+                # Article reference: merge into external law citation if it has no article yet
+                if (current_external_law and last is not None and
+                        last.citation_type == "external" and
+                        last.target_law_name == current_external_law and
+                        last.target_article is None):
+                    last.target_article = citation.target_article
+                    last.target_article_branch = citation.target_article_branch
+                    merge_text(last, citation.target_text)
+                    last_internal_article = None
+                    continue
 
                 # New internal article reference - breaks external law context
                 current_external_law = None
                 citation.citation_type = "internal"
-                consolidated.append(citation)
-                current_internal_article_idx = len(consolidated) - 1
+                consolidated[idx] = citation
+                idx += 1
+                last = citation
+                last_internal_article = citation
 
-            elif citation.link_class in ('sfon3', 'sfon4'):
+            elif link_class in ('sfon3', 'sfon4'):
                 # Paragraph (sfon3) or Item (sfon4) reference
                 merged = False
 
-                # Try to merge with external law citation
-                if current_external_law and len(consolidated) > 0:
-                    last = consolidated[-1]
+                if current_external_law and last is not None:
+                    # Try to merge with external law citation
                     if (last.citation_type == "external" and
-                        last.target_law_name == current_external_law):
-                        # Check if already has paragraph/item
+                            last.target_law_name == current_external_law):
                         if ((citation.target_paragraph and last.target_paragraph) or
-                            (citation.target_item and last.target_item)):
-                            # Create a copy with same context but new paragraph/item
+                                (citation.target_item and last.target_item)):
+                            # Already has paragraph/item: new citation in same context
                             new_citation = Citation(
                                 target_text=citation.target_text,
                                 target_ref_id=citation.target_ref_id,
@@ -410,54 +763,71 @@ class CitationExtractor:
                                 target_paragraph=citation.target_paragraph,
                                 target_item=citation.target_item,
                                 citation_type="external",
-                                link_class=citation.link_class
+                                link_class=link_class
                             )
-                            consolidated.append(new_citation)
+                            consolidated[idx] = new_citation
+                            idx += 1
+                            last = new_citation
                         else:
                             if citation.target_paragraph:
                                 last.target_paragraph = citation.target_paragraph
                             if citation.target_item:
                                 last.target_item = citation.target_item
-                            last.target_text += " " + citation.target_text
+                            merge_text(last, citation.target_text)
                         merged = True
 
-                # Try to merge with previous internal article citation
-                elif current_internal_article_idx is not None:
-                    last_article = consolidated[current_internal_article_idx]
-                    if (last_article.citation_type == "internal" and
-                        last_article.target_article):
-                        # Check if already has paragraph/item
-                        if ((citation.target_paragraph and last_article.target_paragraph) or
-                            (citation.target_item and last_article.target_item)):
-                            # Create copy with same article but new paragraph/item
+                elif last_internal_article is not None:
+                    # Try to merge with previous internal article citation
+                    article_ref = last_internal_article
+                    if (article_ref.citation_type == "internal" and
+                            article_ref.target_article):
+                        if ((citation.target_paragraph and article_ref.target_paragraph) or
+                                (citation.target_item and article_ref.target_item)):
+                            # Already has paragraph/item: new citation for same article
                             new_citation = Citation(
                                 target_text=citation.target_text,
                                 target_ref_id=citation.target_ref_id,
                                 target_type=citation.target_type,
-                                target_law_name=last_article.target_law_name,
-                                target_article=last_article.target_article,
-                                target_article_branch=last_article.target_article_branch,
+                                target_law_name=article_ref.target_law_name,
+                                target_article=article_ref.target_article,
+                                target_article_branch=article_ref.target_article_branch,
                                 target_paragraph=citation.target_paragraph,
                                 target_item=citation.target_item,
                                 citation_type="internal",
-                                link_class=citation.link_class
+                                link_class=link_class
                             )
-                            consolidated.append(new_citation)
+                            consolidated[idx] = new_citation
+                            idx += 1
+                            last = new_citation
                         else:
                             if citation.target_paragraph:
-                                last_article.target_paragraph = citation.target_paragraph
+                                article_ref.target_paragraph = citation.target_paragraph
                             if citation.target_item:
-                                last_article.target_item = citation.target_item
-                            last_article.target_text += " " + citation.target_text
+                                article_ref.target_item = citation.target_item
+                            merge_text(article_ref, citation.target_text)
                         merged = True
 
                 if not merged:
                     # Standalone paragraph/item reference
                     citation.citation_type = "internal"
-                    consolidated.append(citation)
+                    consolidated[idx] = citation
+                    idx += 1
+                    last = citation
+
+        del consolidated[idx:]
+
+        if text_parts:
+            for citation in consolidated:
+                parts = text_parts.get(id(citation))
+                if parts is not None:
+                    citation.target_text = " ".join(parts)
 
         return consolidated
 
+    def _parse_and_consolidate(self, html: str, law_name: str) -> List[Citation]:
+        """Parse citation links from HTML and consolidate them (CPU-bound)."""
+        return self.consolidate_citations(self.parse_citations(html, law_name))
+
     async def extract_citations(
         self,
         mst: str,
@@ -477,45 +847,69 @@ class CitationExtractor:
         Returns:
             CitationResult with all extracted citations
         """
-        start_time = time.time()
-        errors = []
-
-        # Build article display string
-        article_display = f"제{article}조"
-        if article_branch > 0:
-            article_display += f"의{article_branch}"
-
-        # Step 1: Get lsiSeq
-        lsi_seq = await self.get_lsi_seq(law_name, mst)
-        if not lsi_seq:
+        outcome = await self._extract(mst, law_name, article, article_branch)
+        if isinstance(outcome, str):
             return CitationResult(
                 success=False,
                 law_id=mst,
                 law_name=law_name,
-                article=article_display,
+                article=_article_display(article, article_branch),
                 citation_count=0,
                 citations=[],
-                errors=[f"Could not get lsiSeq for {law_name}. Law may not exist or name may be incorrect."]
+                errors=[outcome]
             )
+        return outcome
+
+    async def extract_citations_dict(
+        self,
+        mst: str,
+        law_name: str,
+        article: int,
+        article_branch: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Same as extract_citations(), but returns the JSON-ready dict directly.
+
+        Error results are built as dicts without an intermediate CitationResult.
+        """
+        outcome = await self._extract(mst, law_name, article, article_branch)
+        if isinstance(outcome, str):
+            return _error_result(mst, law_name, _article_display(article, article_branch), outcome)
+        return outcome.to_dict()
+
+    async def _extract(
+        self,
+        mst: str,
+        law_name: str,
+        article: int,
+        article_branch: int
+    ) -> Union[CitationResult, str]:
+        """Run the extraction pipeline. Returns the result, or an error message."""
+        cache_key = (mst, law_name, article, article_branch)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.monotonic() - cached_at <= self._result_cache_ttl:
+                self._result_cache.move_to_end(cache_key)
+                return cached_result
+            del self._result_cache[cache_key]
+
+        start_time = time.time()
+        article_display = _article_display(article, article_branch)
+
+        # Step 1: Get lsiSeq
+        lsi_seq = await self.get_lsi_seq(law_name, mst)
+        if not lsi_seq:
+            return f"Could not get lsiSeq for {law_name}. Law may not exist or name may be incorrect."
 
         # Step 2: Fetch article HTML
         html = await self.fetch_article_html(lsi_seq, article, article_branch)
         if not html:
-            return CitationResult(
-                success=False,
-                law_id=mst,
-                law_name=law_name,
-                article=article_display,
-                citation_count=0,
-                citations=[],
-                errors=[f"Could not fetch HTML for {article_display}. Article may not exist."]
-            )
+            return f"Could not fetch HTML for {article_display}. Article may not exist."
 
-        # Step 3: Parse citations
-        raw_citations = self.parse_citations(html, law_name)
-
-        # Step 4: Consolidate citations
-        consolidated = self.consolidate_citations(raw_citations)
+        # Steps 3-4: Parse and consolidate citations in a worker thread so the
+        # event loop keeps serving other requests' I/O meanwhile
+        consolidated = await asyncio.to_thread(self._parse_and_consolidate, html, law_name)
 
         # Step 5: Convert to dict format
         citation_dicts = [c.to_dict() for c in consolidated]
@@ -526,7 +920,7 @@ class CitationExtractor:
 
         processing_time = (time.time() - start_time) * 1000  # Convert to ms
 
-        return CitationResult(
+        result = CitationResult(
             success=True,
             law_id=mst,
             law_name=law_name,
@@ -537,9 +931,44 @@ class CitationExtractor:
             external_count=external_count,
             extraction_method="html",
             processing_time_ms=round(processing_time, 2),
-            errors=errors
         )
 
+        # Cache successful results only (failures may be transient)
+        while len(self._result_cache) >= self._result_cache_size:
+            self._result_cache.popitem(last=False)
+        self._result_cache[cache_key] = (time.monotonic(), result)
+
+        return result
+
+    async def extract_citations_batch(
+        self,
+        mst: str,
+        law_name: str,
+        articles: List[Tuple[int, int]]
+    ) -> List[CitationResult]:
+        """
+        Extract citations from several articles of the same law concurrently.
+
+        lsiSeq is resolved once up front; article fetches then run in parallel
+        (bounded by max_concurrency), so total latency tracks the slowest
+        article rather than the sum.
+
+        Args:
+            mst: Law MST code (법령일련번호)
+            law_name: Law name for display and lsiSeq lookup
+            articles: List of (article, article_branch) tuples
+
+        Returns:
+            CitationResult per article, in input order
+        """
+        # Warm the lsiSeq cache so concurrent calls don't all fetch the law page
+        await self.get_lsi_seq(law_name, mst)
+
+        return list(await asyncio.gather(*(
+            self.extract_citations(mst, law_name, article, article_branch)
+            for article, article_branch in articles
+        )))
+
 
 # Module-level extractor instance (reused across requests)
 _extractor: Optional[CitationExtractor] = None
@@ -553,6 +982,14 @@ def get_extractor() -> CitationExtractor:
     return _extractor
 
 
+async def close_extractor() -> None:
+    """Close the module-level extractor's HTTP client (call at shutdown)."""
+    global _extractor
+    extractor, _extractor = _extractor, None
+    if extractor is not None:
+        await extractor.aclose()
+
+
 async def extract_article_citations(
     mst: str,
     law_name: str,
@@ -572,5 +1009,4 @@ async def extract_article_citations(
         Citation result as dictionary
     """
     extractor = get_extractor()
-    result = await extractor.extract_citations(mst, law_name, article, article_branch)
-    return result.to_dict()
+    return await extractor.extract_citations_dict(mst, law_name, article, article_branch)
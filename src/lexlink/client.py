@@ -20,6 +20,12 @@ from .errors import ErrorCode, create_error_response, get_http_error_hints
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 
 class LawAPIClient:
     """HTTP client for law.go.kr API with error handling and logging."""
@@ -34,7 +40,24 @@ class LawAPIClient:
         """
         self.base_url = base_url
         self.timeout = timeout
-        self.client = httpx.Client(timeout=timeout, follow_redirects=True)
+        self._endpoint_prefixes: dict[str, str] = {}  # endpoint -> "base_url + endpoint?"
+        # Long-lived pooled client: keep-alive connections are reused across get() calls
+        self.client = httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=_HTTP2_AVAILABLE,
+        )
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self.client.close()
+
+    def __enter__(self) -> "LawAPIClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def build_url(self, endpoint: str, params: dict) -> str:
         """
@@ -52,9 +75,12 @@ class LawAPIClient:
             >>> client.build_url("/DRF/lawSearch.do", {"OC": "g4c", "target": "eflaw"})
             'http://www.law.go.kr/DRF/lawSearch.do?OC=g4c&target=eflaw'
         """
+        prefix = self._endpoint_prefixes.get(endpoint)
+        if prefix is None:
+            prefix = self._endpoint_prefixes[endpoint] = f"{self.base_url}{endpoint}?"
+
         # Don't encode tilde in date ranges (safe="~")
-        query_string = urlencode(params, safe="~")
-        return f"{self.base_url}{endpoint}?{query_string}"
+        return prefix + urlencode(params, safe="~")
 
     def get(
         self,
@@ -101,7 +127,7 @@ class LawAPIClient:
 
         # Log request (no PII - only presence indicators)
         logger.info(
-            f"API Request: {endpoint}",
+            "API Request: %s", endpoint,
             extra={
                 "request_id": request_id,
                 "endpoint": endpoint,
@@ -119,7 +145,7 @@ class LawAPIClient:
             elapsed_ms = int((time.time() - start_time) * 1000)
 
             logger.info(
-                f"API Response: {response.status_code}",
+                "API Response: %s", response.status_code,
                 extra={
                     "request_id": request_id,
                     "status_code": response.status_code,
@@ -150,7 +176,7 @@ class LawAPIClient:
 
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"API HTTP Error: {e.response.status_code}",
+                "API HTTP Error: %s", e.response.status_code,
                 extra={
                     "request_id": request_id,
                     "status_code": e.response.status_code,
@@ -200,10 +226,10 @@ class LawAPIClient:
 
             path = self._parse_antibot_url(response.text)
             if not path:
-                logger.warning(f"Anti-bot page detected but could not parse redirect (hop {i+1})")
+                logger.warning("Anti-bot page detected but could not parse redirect (hop %d)", i + 1)
                 return response
 
-            logger.info(f"Following anti-bot redirect (hop {i+1})")
+            logger.info("Following anti-bot redirect (hop %d)", i + 1)
             response = self.client.get(f"{self.base_url}{path}")
 
             if response.status_code == 404:
@@ -266,7 +292,7 @@ class LawAPIClient:
 
         # Detect auth failure (HTTP 200 but body says auth failed)
         if "사용자 정보 검증에 실패하였습니다" in body:
-            logger.warning(f"Upstream auth failure detected in response body")
+            logger.warning("Upstream auth failure detected in response body")
             return create_error_response(
                 error_code=ErrorCode.UPSTREAM_ERROR,
                 message="법제처 API 인증 실패: 사용자 정보 검증에 실패하였습니다",
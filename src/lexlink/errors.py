@@ -5,7 +5,7 @@ This module provides consistent error handling across the LexLink server,
 ensuring users receive actionable error messages with resolution hints.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class ErrorCode:
@@ -27,7 +27,7 @@ class ErrorCode:
 def create_error_response(
     error_code: str,
     message: str,
-    hints: Optional[list[str]] = None,
+    hints: Optional[Sequence[str]] = None,
     request_id: Optional[str] = None,
     **extra
 ) -> dict:
@@ -72,12 +72,48 @@ def create_error_response(
         response["request_id"] = request_id
 
     # Add any extra fields
-    response.update(extra)
+    if extra:
+        response.update(extra)
 
     return response
 
 
-def get_http_error_hints(status_code: int) -> list[str]:
+# Resolution hints per upstream HTTP status (built once, shared read-only)
+_HTTP_ERROR_HINTS: dict[int, tuple[str, ...]] = {
+    403: (
+        "Check that OC parameter is provided and valid",
+        "Verify OC format: email local part only (g4c@korea.kr → g4c)",
+        "Check if your IP is blocked by law.go.kr",
+    ),
+    404: (
+        "Verify the law ID or MST exists",
+        "Check endpoint URL is correct",
+        "Try searching for the law first to get valid ID",
+    ),
+    429: (
+        "Rate limit exceeded - too many requests",
+        "Wait a few seconds before retrying",
+        "Reduce query frequency",
+    ),
+    500: (
+        "law.go.kr internal error - not your fault",
+        "Retry after a few seconds",
+        "Try a different query to isolate issue",
+    ),
+    502: (
+        "law.go.kr gateway error - service may be down",
+        "Retry after a minute",
+        "Check law.go.kr service status",
+    ),
+    503: (
+        "law.go.kr service unavailable",
+        "Retry after a minute",
+        "Service may be undergoing maintenance",
+    ),
+}
+
+
+def get_http_error_hints(status_code: int) -> tuple[str, ...]:
     """
     Get contextual hints based on HTTP status code from upstream API.
 
@@ -85,50 +121,17 @@ def get_http_error_hints(status_code: int) -> list[str]:
         status_code: HTTP status code from law.go.kr
 
     Returns:
-        List of actionable hints for the user
+        Tuple of actionable hints for the user
 
     Example:
         >>> get_http_error_hints(403)
-        [
+        (
             "Check that OC parameter is provided and valid",
             "Verify OC format: email local part only (g4c@korea.kr → g4c)",
             ...
-        ]
+        )
     """
-    hints_map = {
-        403: [
-            "Check that OC parameter is provided and valid",
-            "Verify OC format: email local part only (g4c@korea.kr → g4c)",
-            "Check if your IP is blocked by law.go.kr",
-        ],
-        404: [
-            "Verify the law ID or MST exists",
-            "Check endpoint URL is correct",
-            "Try searching for the law first to get valid ID",
-        ],
-        429: [
-            "Rate limit exceeded - too many requests",
-            "Wait a few seconds before retrying",
-            "Reduce query frequency",
-        ],
-        500: [
-            "law.go.kr internal error - not your fault",
-            "Retry after a few seconds",
-            "Try a different query to isolate issue",
-        ],
-        502: [
-            "law.go.kr gateway error - service may be down",
-            "Retry after a minute",
-            "Check law.go.kr service status",
-        ],
-        503: [
-            "law.go.kr service unavailable",
-            "Retry after a minute",
-            "Service may be undergoing maintenance",
-        ],
-    }
-
-    return hints_map.get(
-        status_code,
-        [f"Unexpected HTTP {status_code} error - check logs for details"]
-    )
+    hints = _HTTP_ERROR_HINTS.get(status_code)
+    if hints is None:
+        return (f"Unexpected HTTP {status_code} error - check logs for details",)
+    return hints
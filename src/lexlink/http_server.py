@@ -37,156 +37,320 @@ Note:
 """
 
 import os
-import json
+import asyncio
+import functools
 import logging
+import re
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
 
-from starlette.applications import Starlette
-from starlette.middleware import Middleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response, StreamingResponse
-from starlette.routing import Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from mcp.server.fastmcp import FastMCP
 
 from .server import create_server
-from .raw_logger import log_mcp_call, generate_request_id
+from .raw_logger import log_mcp_call, generate_request_id, should_log
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+    _loads = json.loads
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Max bytes of each request/response body kept for logging. Bodies stream
+# through untouched; only the logged copy is capped, so long-lived SSE
+# streams can't grow memory without bound.
+_CAPTURE_LIMIT = 256 * 1024
+
+# SSE field lines ("event:", "data:", "id:") and blank event separators
+_SSE_FIELD_RE = re.compile(rb'^[ \t]*(event|data|id):[ \t]*(.*)$', re.MULTILINE)
+_SSE_BLANK_LINE_RE = re.compile(rb'\n[ \t\r\f\v]*\n')
+
+_HDR_CONTENT_TYPE = b"content-type"
+_HDR_CONTENT_LENGTH = b"content-length"
+
+# Only request bodies that can carry a JSON-RPC payload are captured
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+_JSON_CTYPES = frozenset({b"application/json", b"application/json-rpc"})
+
+# Request headers read by log_mcp_call; everything else is left undecoded
+_LOGGED_HEADERS = frozenset({b"user-agent", b"mcp-session-id", b"x-forwarded-for", b"oc"})
+
+# uvicorn's "auto" loop/http settings already pick uvloop and httptools when
+# they are installed. The access log is off because RawLoggingMiddleware
+# already records every request.
+_UVICORN_OPTIONS = {"loop": "auto", "http": "auto", "access_log": False}
+
+# Pending log entries; only set while the log worker is running. Entries are
+# dropped (not awaited) when the queue is full so logging never stalls a request.
+_LOG_QUEUE_SIZE = 1024
+_log_queue: Optional[asyncio.Queue] = None
+
+
+@dataclass(slots=True)
+class _LogRecord:
+    """One captured request/response pair awaiting `log_mcp_call`."""
+    request_id: str
+    timestamp: str
+    duration_ms: float
+    req_data: Any
+    resp_data: Any
+    headers: dict
+    status_code: int
+    client_ip: Optional[str]
+    response_type: Optional[str]
+
+
+def _write_log(record: _LogRecord) -> None:
+    log_mcp_call(
+        record.request_id,
+        record.timestamp,
+        record.duration_ms,
+        record.req_data,
+        record.resp_data,
+        record.headers,
+        record.status_code,
+        record.client_ip,
+        record.response_type,
+    )
+
 
-class RawLoggingMiddleware(BaseHTTPMiddleware):
+async def _log_worker(queue: asyncio.Queue) -> None:
+    """Drain queued log records, writing each off the event loop."""
+    while True:
+        record = await queue.get()
+        try:
+            await asyncio.to_thread(_write_log, record)
+        except Exception:
+            logger.exception("Failed to write MCP log entry")
+        finally:
+            queue.task_done()
+
+
+@asynccontextmanager
+async def _log_worker_running() -> AsyncIterator[None]:
+    """Run the background log worker for the lifetime of the app."""
+    global _log_queue
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_LOG_QUEUE_SIZE)
+    worker = asyncio.create_task(_log_worker(queue))
+    _log_queue = queue
+    try:
+        yield
+    finally:
+        _log_queue = None
+        await queue.join()
+        worker.cancel()
+
+
+def _submit_log(record: _LogRecord) -> None:
+    """Queue a log record, or write it inline if no worker is running."""
+    if _log_queue is None:
+        _write_log(record)
+        return
+    try:
+        _log_queue.put_nowait(record)
+    except asyncio.QueueFull:
+        logger.warning("MCP log queue full; dropping entry %s", record.request_id)
+
+
+class RawLoggingMiddleware:
     """
     MCP traffic logger for PlayMCP.
 
     Captures request/response pairs and logs in dashboard-compatible format.
+
+    Implemented as raw ASGI middleware (not BaseHTTPMiddleware): request and
+    response bodies are copied as they pass through `receive`/`send`, so the
+    response streams to the client unchanged and no per-request TaskGroup or
+    memory stream is created.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        request_id = generate_request_id()
-        start_time = time.time()
-        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S.") + f"{int((time.time() % 1) * 1000000):06d}"
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only JSON-RPC POSTs can produce a log entry (log_mcp_call drops
+        # anything without a JSON body). Everything else - lifespan/websocket
+        # scopes, GET /sse streams, health checks - passes straight through.
+        if scope["type"] != "http" or scope["method"] not in _BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {}
+        content_type = b""
+        for key, value in scope.get("headers", ()):
+            if key == _HDR_CONTENT_TYPE:
+                content_type = value
+            elif key in _LOGGED_HEADERS:
+                headers[key.decode("latin-1")] = value.decode("latin-1")
+        if (
+            content_type.split(b";", 1)[0].strip().lower() not in _JSON_CTYPES
+            or not should_log()
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        # Capture request body
+        request_id = generate_request_id()
+        start_time = time.perf_counter()
+        timestamp = datetime.now().isoformat(timespec="microseconds")
+
+        request_body = bytearray()
+        response_body = bytearray()
+        response_len = 0
+        response_truncated = False
+        status_code = 0
+        response_type = None
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                room = _CAPTURE_LIMIT - len(request_body)
+                if body and room > 0:
+                    request_body.extend(body if len(body) <= room else memoryview(body)[:room])
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_type, response_truncated, response_body, response_len
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                for key, value in message.get("headers", ()):
+                    key = key.lower()
+                    if key == _HDR_CONTENT_TYPE:
+                        response_type = value.decode("latin-1")
+                    elif key == _HDR_CONTENT_LENGTH and value.isdigit():
+                        # Known size: allocate the capture buffer once
+                        response_body = bytearray(min(int(value), _CAPTURE_LIMIT))
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                if body:
+                    room = _CAPTURE_LIMIT - response_len
+                    if len(body) > room:
+                        response_truncated = True
+                    if room > 0:
+                        # memoryview slice: no temporary copy of a cut chunk
+                        chunk = body if len(body) <= room else memoryview(body)[:room]
+                        end = response_len + len(chunk)
+                        response_body[response_len:end] = chunk
+                        response_len = end
+            # Forward immediately: streaming and backpressure are preserved
+            await send(message)
+
+        await self.app(scope, receive_wrapper, send_wrapper)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        # Drop unused preallocated space (Content-Length overstated or stream cut)
+        del response_body[response_len:]
+
+        # Parse request body
         req_data = None
-        try:
-            body_bytes = await request.body()
-            if body_bytes:
-                try:
-                    req_data = json.loads(body_bytes)
-                except json.JSONDecodeError:
-                    pass
-        except Exception:
-            pass
-
-        # Get response
-        response = await call_next(request)
-        elapsed_ms = (time.time() - start_time) * 1000
+        if request_body:
+            try:
+                req_data = _loads(request_body)
+            except ValueError:
+                pass
 
-        # Capture response body
-        response_body = b""
+        # Parse response body (once, after the stream has ended)
         resp_data = None
-
-        try:
-            if hasattr(response, 'body_iterator'):
-                chunks = []
-                async for chunk in response.body_iterator:
-                    if isinstance(chunk, str):
-                        chunk = chunk.encode('utf-8')
-                    chunks.append(chunk)
-                response_body = b"".join(chunks)
-            elif hasattr(response, 'body'):
-                response_body = response.body
-        except Exception:
-            pass
-
-        # Parse response body
-        if response_body:
-            try:
-                resp_data = json.loads(response_body)
-            except json.JSONDecodeError:
-                decoded = response_body.decode("utf-8", errors="replace")
-                if decoded.startswith("event:") or "\nevent:" in decoded:
-                    resp_data = {"_sse_events": self._parse_sse(decoded)}
-
-        # Log in dashboard format
-        log_mcp_call(
-            request_id=request_id,
-            timestamp=timestamp,
-            duration_ms=elapsed_ms,
-            req_data=req_data,
-            resp_data=resp_data,
-            headers=dict(request.headers),
-            status_code=response.status_code,
-            client_ip=request.client.host if request.client else None,
-            response_type=type(response).__name__,
-        )
-
-        # Return new response with same body
         if response_body:
-            return Response(
-                content=response_body,
-                status_code=response.status_code,
-                headers=dict(response.headers) if hasattr(response, 'headers') else {},
-                media_type=getattr(response, 'media_type', None),
-            )
-        else:
-            return response
-
-    def _parse_sse(self, sse_text: str) -> list:
-        """Parse SSE events from text."""
-        events = []
+            if not response_truncated:
+                try:
+                    resp_data = _loads(response_body)
+                except ValueError:
+                    pass
+            if resp_data is None:
+                if response_body.startswith(b"event:") or b"\nevent:" in response_body:
+                    resp_data = {"_sse_events": self._parse_sse(response_body)}
+
+        client = scope.get("client")
+
+        # Log in dashboard format (written by the background worker)
+        _submit_log(_LogRecord(
+            request_id,
+            timestamp,
+            elapsed_ms,
+            req_data,
+            resp_data,
+            headers,
+            status_code,
+            client[0] if client else None,
+            response_type,
+        ))
+
+    def _parse_sse(self, sse_body: bytes) -> list:
+        """
+        Parse the first SSE event from a raw response body.
+
+        Only the first event is read by log_mcp_call, so parsing stops there
+        and its data payload is left as raw bytes for the log worker to
+        decode off the event loop.
+        """
         current_event = {}
+        last_end = 0
 
-        for line in sse_text.split('\n'):
-            line = line.strip()
-            if not line:
-                if current_event:
-                    events.append(current_event)
-                    current_event = {}
-                continue
-
-            if line.startswith('event:'):
-                current_event['event'] = line[6:].strip()
-            elif line.startswith('data:'):
-                data_str = line[5:].strip()
-                try:
-                    current_event['data'] = json.loads(data_str)
-                except json.JSONDecodeError:
-                    current_event['data'] = data_str
-            elif line.startswith('id:'):
-                current_event['id'] = line[3:].strip()
+        for match in _SSE_FIELD_RE.finditer(sse_body):
+            # A blank line between two fields terminates the current event
+            if current_event and _SSE_BLANK_LINE_RE.search(sse_body, last_end, match.start()):
+                break
+            last_end = match.end()
 
-        if current_event:
-            events.append(current_event)
+            field = match.group(1)
+            raw_value = match.group(2).strip()
+            if field == b"data":
+                current_event['data'] = raw_value
+            else:
+                current_event[field.decode()] = raw_value.decode("utf-8", errors="replace")
 
-        return events
+        return [current_event] if current_event else []
 
 
+@functools.cache
 def get_fastmcp_server() -> FastMCP:
-    """Get the FastMCP server instance."""
+    """Get the FastMCP server instance (created once per process)."""
     return create_server()
 
 
-# Create server instance
-_server: FastMCP = get_fastmcp_server()
+@asynccontextmanager
+async def _shared_clients_closed() -> AsyncIterator[None]:
+    """Close the pooled citation HTTP client when the app shuts down."""
+    try:
+        yield
+    finally:
+        from .citation import close_extractor
+        await close_extractor()
+
+
+@asynccontextmanager
+async def _sse_lifespan(app):
+    async with _log_worker_running(), _shared_clients_closed():
+        yield
 
-# Get the raw SSE app from FastMCP
-_sse_app = _server.sse_app()
 
-# Wrap with our middleware for raw logging
-app = Starlette(
-    routes=[Mount("/", app=_sse_app)],
-    middleware=[
-        Middleware(RawLoggingMiddleware),
-    ]
-)
+def create_app() -> ASGIApp:
+    """
+    Build the SSE ASGI app.
+
+    The FastMCP server is only created here (not at import time). The raw
+    logging middleware is composed directly around FastMCP's Starlette app
+    (no outer Starlette/Mount router hop per request); lifespan is installed
+    on the inner app's router.
+    """
+    sse_app = get_fastmcp_server().sse_app()
+    sse_app.router.lifespan_context = _sse_lifespan
+    return RawLoggingMiddleware(sse_app)
+
+
+def __getattr__(name: str):
+    # `app` used to be built on import; keep it importable, but build lazily
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run_sse_server(host: str = "0.0.0.0", port: int = 8000):
@@ -202,10 +366,10 @@ def run_sse_server(host: str = "0.0.0.0", port: int = 8000):
     """
     import uvicorn
 
-    logger.info(f"Starting LexLink MCP server (SSE) on {host}:{port}")
-    logger.info(f"Endpoint: http://{host}:{port}/sse")
+    logger.info("Starting LexLink MCP server (SSE) on %s:%s", host, port)
+    logger.info("Endpoint: http://%s:%s/sse", host, port)
 
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(create_app, factory=True, host=host, port=port, **_UVICORN_OPTIONS)
 
 
 def run_http_server(host: str = "0.0.0.0", port: int = 8000):
@@ -220,12 +384,12 @@ def run_http_server(host: str = "0.0.0.0", port: int = 8000):
         port: Port to listen on (default: 8000)
     """
     import uvicorn
-    from contextlib import asynccontextmanager
 
-    logger.info(f"Starting LexLink MCP server (HTTP) on {host}:{port}")
-    logger.info(f"Endpoint: http://{host}:{port}/mcp")
+    logger.info("Starting LexLink MCP server (HTTP) on %s:%s", host, port)
+    logger.info("Endpoint: http://%s:%s/mcp", host, port)
 
-    fastmcp = create_server()
+    # Reuse the module-level server instead of building the tools twice
+    fastmcp = get_fastmcp_server()
 
     # Get the streamable HTTP app with proper configuration
     _http_app = fastmcp.streamable_http_app()
@@ -233,17 +397,12 @@ def run_http_server(host: str = "0.0.0.0", port: int = 8000):
     # Create lifespan that properly initializes the session manager
     @asynccontextmanager
     async def lifespan(app):
-        async with fastmcp.session_manager.run():
+        async with _log_worker_running(), _shared_clients_closed(), fastmcp.session_manager.run():
             yield
 
-    http_app = Starlette(
-        routes=[Mount("/", app=_http_app)],
-        middleware=[
-            Middleware(RawLoggingMiddleware),
-        ],
-        lifespan=lifespan
-    )
-    uvicorn.run(http_app, host=host, port=port)
+    _http_app.router.lifespan_context = lifespan
+    http_app = RawLoggingMiddleware(_http_app)
+    uvicorn.run(http_app, host=host, port=port, **_UVICORN_OPTIONS)
 
 
 def main():
@@ -256,6 +415,11 @@ def main():
         TRANSPORT: Transport type - "sse" or "http" (default: sse)
         OC: Server's OC for law.go.kr API (must have server IP registered)
     """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     port = int(os.getenv("PORT", "8000"))
     host = os.getenv("HOST", "0.0.0.0")
     transport = os.getenv("TRANSPORT", "sse")  # "sse" or "http"
@@ -5,10 +5,25 @@ Merges request/response pairs and extracts fields needed for dashboard filtering
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_line(obj: Any) -> bytes:
+        # orjson emits UTF-8 as-is (no ASCII escaping), like ensure_ascii=False
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+
 
 def process_raw_logs(input_path: Path, output_path: Optional[Path] = None) -> list[dict]:
     """
@@ -21,23 +36,26 @@ def process_raw_logs(input_path: Path, output_path: Optional[Path] = None) -> li
     Returns:
         List of processed log entries
     """
-    # Read raw logs
-    raw_logs = []
-    with open(input_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                raw_logs.append(json.loads(line))
-
-    # Group by request_id
+    # Read and group raw logs by request_id in one pass (no intermediate list).
+    # Lines stay bytes: both orjson and json parse UTF-8 bytes directly.
     requests = {}
     responses = {}
 
-    for log in raw_logs:
-        req_id = log.get('request_id')
-        if log.get('phase') == 'request':
-            requests[req_id] = log
-        elif log.get('phase') == 'response':
-            responses[req_id] = log
+    with open(input_path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            log = _loads(line)
+            req_id = log.get('request_id')
+            if isinstance(req_id, str):
+                # Request and response lines share the id: intern it so the
+                # later responses.get(req_id) compares by identity
+                req_id = sys.intern(req_id)
+            phase = log.get('phase')
+            if phase == 'request':
+                requests[req_id] = log
+            elif phase == 'response':
+                responses[req_id] = log
 
     # Merge and transform
     processed = []
@@ -52,9 +70,9 @@ def process_raw_logs(input_path: Path, output_path: Optional[Path] = None) -> li
 
     # Write output if path provided
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'wb') as f:
             for entry in processed:
-                f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+                f.write(_dumps_line(entry))
 
     return processed
 
@@ -124,7 +142,7 @@ def transform_to_dashboard_format(req_id: str, req: dict, resp: dict) -> Optiona
     # Extract client info (from initialize params or headers)
     params = req_data.get('params', {})
     client_info = params.get('clientInfo', {})
-    client = client_info.get('name') or headers.get('user-agent', '').split('/')[0]
+    client = client_info.get('name') or headers.get('user-agent', '').partition('/')[0]
     client_version = client_info.get('version')
     protocol_version = params.get('protocolVersion')
 
@@ -172,12 +190,18 @@ def transform_to_dashboard_format(req_id: str, req: dict, resp: dict) -> Optiona
         'response_type': resp.get('response_type'),
     }
 
-    # Clean up None values for cleaner output
-    entry = {k: v for k, v in entry.items() if v is not None}
+    # Clean up None values for cleaner output (in place, no second dict)
+    for key in [k for k, v in entry.items() if v is None]:
+        del entry[key]
 
     return entry
 
 
+# Serialized tool-result fragments that mark an error/empty text result
+_ERROR_TEXT_MARKER = '"status": "error"'
+_EMPTY_TEXT_MARKER = '"totalCnt": 0'
+
+
 def get_empty_result_status(result: Any) -> bool:
     """Check if result is empty/error (yellow circle in dashboard)."""
     if not result:
@@ -192,22 +216,21 @@ def get_empty_result_status(result: Any) -> bool:
             return True
         # Check for empty content
         content = result.get('content')
-        if isinstance(content, list) and len(content) == 0:
-            return True
-        if isinstance(content, list) and len(content) == 1:
-            # Check if content[0] has text with error
-            item = content[0]
-            if isinstance(item, dict) and item.get('type') == 'text':
-                text = item.get('text', '')
-                if '"status": "error"' in text or '"totalCnt": 0' in text:
-                    return True
+        if isinstance(content, list):
+            if not content:
+                return True
+            if len(content) == 1:
+                # Check if content[0] has text with error
+                item = content[0]
+                if isinstance(item, dict) and item.get('type') == 'text':
+                    text = item.get('text', '')
+                    if _ERROR_TEXT_MARKER in text or _EMPTY_TEXT_MARKER in text:
+                        return True
 
     return False
 
 
 if __name__ == '__main__':
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: python log_processor.py <input.jsonl> [output.jsonl]")
         sys.exit(1)
@@ -57,6 +57,78 @@ def resolve_oc(override_oc: Optional[str] = None) -> str:
     )
 
 
+# snake_case tool parameter -> law.go.kr API parameter (built once at import)
+_PARAM_MAP = {
+    # Session/auth (UPPERCASE)
+    "oc": "OC",
+
+    # Common search params (camelCase)
+    "ef_yd": "efYd",      # 시행일자 범위
+    "anc_yd": "ancYd",    # 공포일자 범위
+    "anc_no": "ancNo",    # 공포번호 범위
+    "prml_yd": "prmlYd",  # 발령일자 범위 (administrative rules)
+    "mod_yd": "modYd",    # 수정일자 범위 (administrative rules)
+    "rr_cls_cd": "rrClsCd",  # 제개정 종류 코드
+    "pop_yn": "popYn",    # 팝업 여부
+    "ls_chap_no": "lsChapNo",  # 법령체계 장번호
+    "chr_cls_cd": "chrClsCd",  # 한글/원문 구분
+
+    # Phase 3: Case Law & Legal Research (camelCase)
+    "prnc_yd": "prncYd",  # 선고일자 기간 (precedent decision date range)
+    "dat_src_nm": "datSrcNm",  # 데이터출처명 (data source name)
+    "ed_yd": "edYd",      # 종국일자 기간 (constitutional final date range)
+    "reg_yd": "regYd",    # 등록일자 기간 (interpretation registration date range)
+    "expl_yd": "explYd",  # 해석일자 기간 (interpretation explanation date range)
+    "dpa_yd": "dpaYd",    # 처분일자 기간 (appeal disposition date range)
+    "rsl_yd": "rslYd",    # 의결일자 기간 (appeal resolution date range)
+
+    # Phase 7: Treaties (camelCase)
+    "eft_yd": "eftYd",    # 발효일자 범위 (treaty effective date range)
+    "conc_yd": "concYd",  # 체결일자 범위 (treaty conclusion date range)
+    "nat_cd": "natCd",    # 국가코드 (country code)
+
+    # Phase 7: Local Ordinances
+    "sborg": "sborg",     # 지자체 시/군/구 (pass-through)
+    "ordin_fd": "ordinFd",  # 분류코드 (ordinance classification)
+
+    # Service params (ID/MST uppercase per API convention)
+    "id": "ID",
+    "mst": "MST",
+
+    # Article navigation (UPPERCASE)
+    "jo": "JO",          # 조
+    "jobr": "JOBR",      # 조 가지번호 (article branch number)
+    "hang": "HANG",      # 항
+    "ho": "HO",          # 호
+    "mok": "MOK",        # 목 (requires UTF-8 encoding)
+
+    # Pass-through (no change needed)
+    "target": "target",
+    "type": "type",
+    "query": "query",
+    "display": "display",
+    "page": "page",
+    "sort": "sort",
+    "date": "date",
+    "nb": "nb",          # 사건번호 (case number, also used in precedents/constitutional)
+    "org": "org",
+    "knd": "knd",
+    "gana": "gana",      # 사전식 검색 (dictionary search)
+    "search": "search",
+    "nw": "nw",
+    "ld": "ld",
+    "ln": "ln",
+    "lm": "lm",
+    "lang": "lang",
+    "lid": "LID",
+    "curt": "curt",      # 법원명 (court name, precedents)
+    "inq": "inq",        # 질의기관 (inquiry org, interpretations)
+    "rpl": "rpl",        # 회신기관 (reply org, interpretations)
+    "itmno": "itmno",    # 안건번호 (item number, interpretations)
+    "cls": "cls",        # 재결례유형 (decision type, admin appeals)
+}
+
+
 def map_params_to_upstream(snake_params: dict) -> dict:
     """
     Convert snake_case tool parameters to law.go.kr API format.
@@ -87,77 +159,6 @@ def map_params_to_upstream(snake_params: dict) -> dict:
             "query": "자동차관리법"
         }
     """
-    # Define comprehensive mapping table
-    PARAM_MAP = {
-        # Session/auth (UPPERCASE)
-        "oc": "OC",
-
-        # Common search params (camelCase)
-        "ef_yd": "efYd",      # 시행일자 범위
-        "anc_yd": "ancYd",    # 공포일자 범위
-        "anc_no": "ancNo",    # 공포번호 범위
-        "prml_yd": "prmlYd",  # 발령일자 범위 (administrative rules)
-        "mod_yd": "modYd",    # 수정일자 범위 (administrative rules)
-        "rr_cls_cd": "rrClsCd",  # 제개정 종류 코드
-        "pop_yn": "popYn",    # 팝업 여부
-        "ls_chap_no": "lsChapNo",  # 법령체계 장번호
-        "chr_cls_cd": "chrClsCd",  # 한글/원문 구분
-
-        # Phase 3: Case Law & Legal Research (camelCase)
-        "prnc_yd": "prncYd",  # 선고일자 기간 (precedent decision date range)
-        "dat_src_nm": "datSrcNm",  # 데이터출처명 (data source name)
-        "ed_yd": "edYd",      # 종국일자 기간 (constitutional final date range)
-        "reg_yd": "regYd",    # 등록일자 기간 (interpretation registration date range)
-        "expl_yd": "explYd",  # 해석일자 기간 (interpretation explanation date range)
-        "dpa_yd": "dpaYd",    # 처분일자 기간 (appeal disposition date range)
-        "rsl_yd": "rslYd",    # 의결일자 기간 (appeal resolution date range)
-
-        # Phase 7: Treaties (camelCase)
-        "eft_yd": "eftYd",    # 발효일자 범위 (treaty effective date range)
-        "conc_yd": "concYd",  # 체결일자 범위 (treaty conclusion date range)
-        "nat_cd": "natCd",    # 국가코드 (country code)
-
-        # Phase 7: Local Ordinances
-        "sborg": "sborg",     # 지자체 시/군/구 (pass-through)
-        "ordin_fd": "ordinFd",  # 분류코드 (ordinance classification)
-
-        # Service params (ID/MST uppercase per API convention)
-        "id": "ID",
-        "mst": "MST",
-
-        # Article navigation (UPPERCASE)
-        "jo": "JO",          # 조
-        "jobr": "JOBR",      # 조 가지번호 (article branch number)
-        "hang": "HANG",      # 항
-        "ho": "HO",          # 호
-        "mok": "MOK",        # 목 (requires UTF-8 encoding)
-
-        # Pass-through (no change needed)
-        "target": "target",
-        "type": "type",
-        "query": "query",
-        "display": "display",
-        "page": "page",
-        "sort": "sort",
-        "date": "date",
-        "nb": "nb",          # 사건번호 (case number, also used in precedents/constitutional)
-        "org": "org",
-        "knd": "knd",
-        "gana": "gana",      # 사전식 검색 (dictionary search)
-        "search": "search",
-        "nw": "nw",
-        "ld": "ld",
-        "ln": "ln",
-        "lm": "lm",
-        "lang": "lang",
-        "lid": "LID",
-        "curt": "curt",      # 법원명 (court name, precedents)
-        "inq": "inq",        # 질의기관 (inquiry org, interpretations)
-        "rpl": "rpl",        # 회신기관 (reply org, interpretations)
-        "itmno": "itmno",    # 안건번호 (item number, interpretations)
-        "cls": "cls",        # 재결례유형 (decision type, admin appeals)
-    }
-
     upstream_params = {}
 
     for snake_key, value in snake_params.items():
@@ -166,7 +167,7 @@ def map_params_to_upstream(snake_params: dict) -> dict:
             continue
 
         # Get upstream key from mapping (default to original if not in map)
-        upstream_key = PARAM_MAP.get(snake_key, snake_key)
+        upstream_key = _PARAM_MAP.get(snake_key, snake_key)
 
         # Special handling for MOK (UTF-8 percent-encoding)
         if upstream_key == "MOK" and isinstance(value, str):
@@ -177,6 +178,10 @@ def map_params_to_upstream(snake_params: dict) -> dict:
     return upstream_params
 
 
+# MOK values are almost always one of the 14 sub-item letters; encode them once
+_MOK_TABLE = {ch: quote(ch.encode("utf-8"), safe="") for ch in "가나다라마바사아자차카타파하"}
+
+
 def encode_mok(value: str) -> str:
     """
     UTF-8 percent-encode MOK parameter.
@@ -200,5 +205,9 @@ def encode_mok(value: str) -> str:
         >>> encode_mok("다")
         '%EB%8B%A4'
     """
+    encoded = _MOK_TABLE.get(value)
+    if encoded is not None:
+        return encoded
+
     # Encode to UTF-8 bytes, then percent-encode
     return quote(value.encode("utf-8"), safe="")
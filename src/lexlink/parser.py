@@ -5,10 +5,33 @@ Provides functions to parse XML responses and extract structured data
 for ranking and further processing.
 """
 
-import xml.etree.ElementTree as ET
 from typing import Dict, List, Any, Optional
 import logging
 
+try:
+    from lxml import etree as ET
+
+    # Comments/PIs would otherwise show up as children with non-string tags;
+    # entities are not expanded (no XXE) and the str input is fed as UTF-8.
+    _XML_PARSER = ET.XMLParser(
+        encoding="utf-8",
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    _ParseError = ET.XMLSyntaxError
+
+    def _fromstring(xml_content: str):
+        return ET.fromstring(xml_content.encode("utf-8"), _XML_PARSER)
+except ImportError:  # pragma: no cover - lxml is optional
+    import xml.etree.ElementTree as ET
+
+    _ParseError = ET.ParseError
+
+    def _fromstring(xml_content: str):
+        return ET.fromstring(xml_content)
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,26 +60,76 @@ def parse_xml_response(xml_content: str) -> Optional[Dict[str, Any]]:
         1
     """
     try:
-        root = ET.fromstring(xml_content)
+        root = _fromstring(xml_content)
         return _element_to_dict(root)
-    except ET.ParseError as e:
-        logger.warning(f"XML parsing failed: {e}")
+    except _ParseError as e:
+        logger.warning("XML parsing failed: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error parsing XML: {e}")
+        logger.error("Unexpected error parsing XML: %s", e)
         return None
 
 
-def _element_to_dict(element: ET.Element) -> Dict[str, Any]:
+def _element_to_dict(element) -> Dict[str, Any]:
     """
-    Recursively convert XML element to dictionary.
+    Convert XML element to dictionary.
+
+    Walks the tree with an explicit stack instead of recursing, so large
+    responses don't pay a Python frame per node (or hit the recursion limit).
 
     Args:
-        element: XML element from ElementTree
+        element: XML element (lxml or ElementTree)
 
     Returns:
         Dictionary representation of the element
     """
+    text = element.text
+    if text and len(element) == 0:  # No children - leaf node
+        stripped = text.strip()
+        if stripped:
+            return stripped
+
+    # Each frame: (element, its result dict, iterator over remaining children)
+    stack = [(element, _start_dict(element), iter(element))]
+    while stack:
+        node, result, children = stack[-1]
+        for child in children:
+            if len(child):
+                # Descend; this frame resumes from the next child afterwards
+                stack.append((child, _start_dict(child), iter(child)))
+                break
+
+            # Leaf: its stripped text, else its attributes, else raw text
+            text = child.text
+            child_data = text.strip() if text else None
+            if not child_data:
+                child_data = dict(child.attrib) if child.attrib else text
+
+            # Handle multiple elements with same tag (make it a list)
+            child_tag = child.tag
+            if child_tag in result:
+                if not isinstance(result[child_tag], list):
+                    result[child_tag] = [result[child_tag]]
+                result[child_tag].append(child_data)
+            else:
+                result[child_tag] = child_data
+        else:
+            stack.pop()
+            node_data = result if result else node.text
+            if not stack:
+                return node_data
+            parent = stack[-1][1]
+            node_tag = node.tag
+            if node_tag in parent:
+                if not isinstance(parent[node_tag], list):
+                    parent[node_tag] = [parent[node_tag]]
+                parent[node_tag].append(node_data)
+            else:
+                parent[node_tag] = node_data
+
+
+def _start_dict(element) -> Dict[str, Any]:
+    """Dict for an element that is not a text leaf: attributes, then _text."""
     result = {}
 
     # Add attributes
@@ -64,25 +137,11 @@ def _element_to_dict(element: ET.Element) -> Dict[str, Any]:
         result.update(element.attrib)
 
     # Add text content
-    if element.text and element.text.strip():
-        if len(element) == 0:  # No children - leaf node
-            return element.text.strip()
-        result['_text'] = element.text.strip()
-
-    # Process children
-    for child in element:
-        child_data = _element_to_dict(child)
-        child_tag = child.tag
-
-        # Handle multiple elements with same tag (make it a list)
-        if child_tag in result:
-            if not isinstance(result[child_tag], list):
-                result[child_tag] = [result[child_tag]]
-            result[child_tag].append(child_data)
-        else:
-            result[child_tag] = child_data
+    text = element.text
+    if text and text.strip():
+        result['_text'] = text.strip()
 
-    return result if result else element.text
+    return result
 
 
 def extract_items_list(parsed_data: Dict[str, Any], item_key: str) -> List[Dict[str, Any]]:
@@ -114,9 +173,10 @@ def extract_items_list(parsed_data: Dict[str, Any], item_key: str) -> List[Dict[
 
     # Try case-insensitive key matching (API uses inconsistent casing)
     # e.g., 'prec' vs 'Detc' vs 'Expc' vs 'Decc'
+    item_key_lower = item_key.lower()
     actual_key = None
-    for key in parsed_data.keys():
-        if key.lower() == item_key.lower():
+    for key in parsed_data:
+        if key.lower() == item_key_lower:
             actual_key = key
             break
 
@@ -151,9 +211,10 @@ def update_items_list(parsed_data: Dict[str, Any], ranked_items: List[Dict[str,
         return parsed_data
 
     # Find the actual key (case-insensitive) to preserve original casing
+    item_key_lower = item_key.lower()
     actual_key = item_key
-    for key in parsed_data.keys():
-        if key.lower() == item_key.lower():
+    for key in parsed_data:
+        if key.lower() == item_key_lower:
             actual_key = key
             break
 
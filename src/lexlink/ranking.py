@@ -6,8 +6,23 @@ which doesn't prioritize exact matches or relevance. This module provides
 ranking logic to reorder results by relevance to the search query.
 """
 
+import functools
+import re
+from operator import itemgetter
 from typing import List, Dict, Any
 
+# Hangul Unicode ranges: 0xAC00-0xD7A3 (syllables), plus Hangul Jamo
+# 0x1100-0x11FF and Hangul Compatibility Jamo 0x3130-0x318F
+_HANGUL_RE = re.compile('[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]')
+
+# rank_search_results priority buckets (lower ranks first)
+_EXACT = 0
+_STARTS = 1
+_WORD = 2
+_CONTAINS = 3
+_NO_MATCH = 4
+_EMPTY_NAME = 5
+
 
 def rank_search_results(
     results: List[Dict[str, Any]],
@@ -52,56 +67,60 @@ def rank_search_results(
     if not results or not query:
         return results
 
-    def calculate_score(result: Dict[str, Any]) -> tuple:
-        """
-        Calculate relevance score for a single result.
-
-        Returns a tuple for sorting where lower values = higher priority.
-        Python sorts tuples lexicographically (element by element).
-        """
+    query_lower = query.lower().strip()
+
+    # Bucket each result by match priority, keeping its name length for the
+    # in-bucket sort (shorter = more specific). Bucket placement is O(N) and
+    # only the small buckets are sorted.
+    buckets = [[] for _ in range(_EMPTY_NAME + 1)]
+    # Track whether the input already is in ranked order (non-decreasing
+    # priority, then length); if so the sort can be skipped entirely
+    in_order = True
+    last_priority = last_length = 0
+    for result in results:
         name = result.get(name_field, '').strip()
         if not name:
             # Empty names go to the end
-            return (999, 999, 999, 999, len(name))
+            buckets[_EMPTY_NAME].append((0, result))
+            last_priority, last_length = _EMPTY_NAME, 0
+            continue
 
-        query_lower = query.lower().strip()
         name_lower = name.lower()
-
-        # Score 1: Exact match (highest priority)
-        # 0 = exact match, 1 = not exact match
-        exact_match = 0 if name_lower == query_lower else 1
-
-        # Score 2: Starts with query
-        # 0 = starts with query, 1 = doesn't start with
-        starts_with = 0 if name_lower.startswith(query_lower) else 1
-
-        # Score 3: Query is a complete word/segment
-        # For Korean, check if query appears at word boundaries
-        if query_lower in name_lower:
-            idx = name_lower.find(query_lower)
-            # Check if it's at the start or has space before it
-            is_word_boundary = (idx == 0 or name_lower[idx-1] == ' ')
-            word_match = 0 if is_word_boundary else 1
+        idx = name_lower.find(query_lower)
+
+        # Query is a complete word/segment - for Korean, check if query
+        # appears at word boundaries (start or space before it)
+        if idx < 0:
+            priority = _NO_MATCH
+        elif idx == 0:
+            priority = _EXACT if name_lower == query_lower else _STARTS
+        elif name_lower[idx - 1] == ' ':
+            priority = _WORD
         else:
-            word_match = 1
-
-        # Score 4: Contains query anywhere
-        # 0 = contains query, 1 = doesn't contain
-        contains = 0 if query_lower in name_lower else 1
-
-        # Score 5: Length penalty (prefer shorter, more specific names)
-        # Shorter names are generally more specific
-        length_penalty = len(name)
-
-        # Return tuple for sorting (all negated so lower = better)
-        # Priority order: exact > starts > word > contains > shorter
-        return (exact_match, starts_with, word_match, contains, length_penalty)
+            priority = _CONTAINS
+
+        length = len(name)
+        buckets[priority].append((length, result))
+        if in_order:
+            if priority < last_priority or (
+                priority == last_priority and length < last_length
+            ):
+                in_order = False
+            last_priority, last_length = priority, length
+
+    if in_order:
+        return results
 
-    # Sort by relevance score
-    ranked_results = sorted(results, key=calculate_score)
+    # Stable sort on length only (result dicts are never compared)
+    ranked_results = []
+    for bucket in buckets:
+        if bucket:
+            bucket.sort(key=itemgetter(0))
+            ranked_results.extend([result for _, result in bucket])
     return ranked_results
 
 
+@functools.lru_cache(maxsize=4096)
 def detect_query_language(query: str) -> str:
     """
     Detect if query is in Korean or English.
@@ -124,19 +143,18 @@ def detect_query_language(query: str) -> str:
     if not query:
         return "english"
 
-    # Check if any character is Hangul (Korean)
-    # Hangul Unicode range: 0xAC00-0xD7A3 (syllables)
-    # Also check Hangul Jamo: 0x1100-0x11FF, 0x3130-0x318F
-    for char in query:
-        code = ord(char)
-        if (0xAC00 <= code <= 0xD7A3 or  # Hangul syllables
-            0x1100 <= code <= 0x11FF or  # Hangul Jamo
-            0x3130 <= code <= 0x318F):   # Hangul Compatibility Jamo
-            return "korean"
+    # Pure-ASCII queries can't contain Hangul (O(1): CPython tracks this)
+    if query.isascii():
+        return "english"
+
+    # Check if any character is Hangul (Korean), scanning in C
+    if _HANGUL_RE.search(query):
+        return "korean"
 
     return "english"
 
 
+@functools.lru_cache(maxsize=4096)
 def should_apply_ranking(query: str) -> bool:
     """
     Determine if ranking should be applied for a given query.
@@ -158,16 +176,15 @@ def should_apply_ranking(query: str) -> bool:
         >>> should_apply_ranking("a")  # Too short
         False
     """
-    if not query or query.strip() == "":
+    if not query:
         return False
 
+    stripped = query.strip()
+
     # Don't rank wildcard queries
-    if query.strip() == "*":
+    if stripped == "*":
         return False
 
-    # Don't rank very short queries (1 character)
+    # Don't rank empty or very short queries (1 character)
     # These may be intentionally broad searches
-    if len(query.strip()) < 2:
-        return False
-
-    return True
+    return len(stripped) >= 2
@@ -6,30 +6,122 @@ with the Smithery dashboard for filtering and analysis.
 """
 
 import json
-import uuid
+import logging
+import math
+import os
+import random
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_line(obj: Any) -> bytes:
+        # orjson emits UTF-8 as-is (no ASCII escaping), like ensure_ascii=False
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+logger = logging.getLogger(__name__)
 
 # Log directory
 LOG_DIR = Path(__file__).parent.parent.parent / "logs" / "playmcp"
 
+# Logging switch and sample rate, read once at import.
+# LEXLINK_RAW_LOG=0 turns raw traffic logging off entirely;
+# LEXLINK_RAW_LOG_SAMPLE (0.0-1.0) logs only that fraction of MCP calls.
+LOG_ENABLED = os.getenv("LEXLINK_RAW_LOG", "1") != "0"
+
+
+def _read_sample_rate() -> float:
+    """Parse LEXLINK_RAW_LOG_SAMPLE, clamped to [0, 1]; bad values log everything."""
+    raw = os.getenv("LEXLINK_RAW_LOG_SAMPLE") or "1.0"
+    try:
+        rate = float(raw)
+    except ValueError:
+        rate = math.nan
+    if math.isnan(rate):
+        logger.warning("Invalid LEXLINK_RAW_LOG_SAMPLE=%r; using 1.0", raw)
+        return 1.0
+    if not 0.0 <= rate <= 1.0:
+        logger.warning("LEXLINK_RAW_LOG_SAMPLE=%r out of range; clamping to [0, 1]", raw)
+        rate = min(max(rate, 0.0), 1.0)
+    return rate
+
+
+LOG_SAMPLE_RATE = _read_sample_rate()
+
 
 def ensure_log_dir():
     """Create log directory if not exists."""
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Cached path of the current day's log file and the local time (epoch
+# seconds) at which it rolls over to the next day
+_log_file: Optional[Path] = None
+_log_file_until: float = 0.0
+
+
 def get_log_file() -> Path:
     """Get today's log file path."""
-    ensure_log_dir()
-    today = datetime.now().strftime("%Y-%m-%d")
-    return LOG_DIR / f"{today}.jsonl"
+    global _log_file, _log_file_until
+    now = time.time()
+    if _log_file is None or now >= _log_file_until:
+        ensure_log_dir()
+        lt = time.localtime(now)
+        _log_file = LOG_DIR / f"{time.strftime('%Y-%m-%d', lt)}.jsonl"
+        # Next local midnight; mktime normalizes tm_mday overflow
+        _log_file_until = time.mktime(
+            (lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+        )
+    return _log_file
+
+
+# Append handle for the current log file, reopened when the day rolls over
+_log_fh: Optional[BinaryIO] = None
+_log_fh_path: Optional[Path] = None
+_log_lock = threading.Lock()
+
+
+def _append_line(line: bytes) -> None:
+    """Append one line to today's log file, reusing the open handle."""
+    global _log_fh, _log_fh_path
+    log_file = get_log_file()
+    with _log_lock:
+        if _log_fh is None or log_file is not _log_fh_path:
+            if _log_fh is not None:
+                _log_fh.close()
+                _log_fh = None
+            _log_fh = open(log_file, "ab")
+            _log_fh_path = log_file
+        _log_fh.write(line)
+        # Flush per line so log_processor sees complete entries
+        _log_fh.flush()
+
+
+def should_log() -> bool:
+    """Decide whether to capture an MCP call (logging enabled and sampled in)."""
+    if not LOG_ENABLED:
+        return False
+    return LOG_SAMPLE_RATE >= 1.0 or random.random() < LOG_SAMPLE_RATE
 
 
 def generate_request_id() -> str:
     """Generate unique request ID."""
-    return str(uuid.uuid4())[:8]
+    return os.urandom(4).hex()
 
 
 def log_raw(
@@ -47,6 +139,9 @@ def log_raw(
         data: Raw data (will be JSON serialized)
         extra: Additional metadata
     """
+    if not LOG_ENABLED:
+        return
+
     log_entry = {
         "timestamp": datetime.now().isoformat(),
         "request_id": request_id,
@@ -56,9 +151,7 @@ def log_raw(
     }
 
     try:
-        log_file = get_log_file()
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False, default=str) + "\n")
+        _append_line(_dumps_line(log_entry))
     except Exception as e:
         # Don't crash on logging errors
         print(f"[RAW_LOGGER] Error writing log: {e}")
@@ -80,7 +173,13 @@ def log_mcp_call(
 
     This is the primary logging function for PlayMCP traffic.
     Format matches the Smithery dashboard schema.
+
+    headers must have lowercase names, as ASGI delivers them. The first
+    `_sse_events` entry's data may be the raw (undecoded) JSON payload.
     """
+    if not LOG_ENABLED:
+        return
+
     if not req_data or not isinstance(req_data, dict):
         return  # Skip non-JSON requests
 
@@ -97,10 +196,18 @@ def log_mcp_call(
         sse_events = resp_data.get('_sse_events', [])
         if sse_events:
             event_data = sse_events[0].get('data', {})
-            result = event_data.get('result')
-            error = event_data.get('error')
-            if error:
-                is_error = True
+            # Middleware passes the raw data payload; only this first
+            # event is ever decoded
+            if isinstance(event_data, (bytes, str)):
+                try:
+                    event_data = _loads(event_data)
+                except ValueError:
+                    event_data = None
+            if isinstance(event_data, dict):
+                result = event_data.get('result')
+                error = event_data.get('error')
+                if error:
+                    is_error = True
 
     # Check result.isError flag
     if result and isinstance(result, dict) and result.get('isError'):
@@ -115,7 +222,7 @@ def log_mcp_call(
     # Extract client info
     params = req_data.get('params', {})
     client_info = params.get('clientInfo', {})
-    client = client_info.get('name') or headers.get('user-agent', '').split('/')[0]
+    client = client_info.get('name') or headers.get('user-agent', '').partition('/')[0]
     client_version = client_info.get('version')
     protocol_version = params.get('protocolVersion')
 
@@ -126,6 +233,15 @@ def log_mcp_call(
         tool_name = params.get('name')
         arguments = params.get('arguments')
 
+    # Only non-None params are logged
+    request_params = {}
+    if arguments is not None:
+        request_params['arguments'] = arguments
+    if client_info:
+        request_params['clientInfo'] = client_info
+    if protocol_version is not None:
+        request_params['protocolVersion'] = protocol_version
+
     # Build dashboard entry
     entry = {
         # Identifiers
@@ -140,18 +256,14 @@ def log_mcp_call(
         # Request info
         'method': method,
         'tool_name': tool_name,
-        'params': {
-            'arguments': arguments,
-            'clientInfo': client_info if client_info else None,
-            'protocolVersion': protocol_version,
-        },
+        'params': request_params,
 
         # Client info
         'client': client,
         'client_version': client_version,
         'protocol_version': protocol_version,
         'client_ip': headers.get('x-forwarded-for') or client_ip,
-        'oc': headers.get('oc') or headers.get('OC'),
+        'oc': headers.get('oc'),
 
         # Response info
         'status': status,
@@ -163,16 +275,11 @@ def log_mcp_call(
         'response_type': response_type,
     }
 
-    # Clean up None values
-    entry = {k: v for k, v in entry.items() if v is not None}
-
-    # Also clean params
-    if 'params' in entry:
-        entry['params'] = {k: v for k, v in entry['params'].items() if v is not None}
+    # Clean up None values (in place, no second dict)
+    for key in [k for k, v in entry.items() if v is None]:
+        del entry[key]
 
     try:
-        log_file = get_log_file()
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        _append_line(_dumps_line(entry))
     except Exception as e:
         print(f"[MCP_LOGGER] Error writing log: {e}")
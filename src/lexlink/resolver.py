@@ -131,7 +131,7 @@ class LawNameResolver:
         if key in self._aliases:
             resolved = self._aliases[key]
             if resolved != corrected:
-                logger.debug(f"Resolved alias: '{query}' → '{resolved}'")
+                logger.debug("Resolved alias: '%s' → '%s'", query, resolved)
             return resolved
 
         # Step 3: Check if query ends with common suffixes and try without
@@ -142,7 +142,7 @@ class LawNameResolver:
                 base_key = base.lower().strip()
                 if base_key in self._aliases:
                     resolved = self._aliases[base_key] + suffix
-                    logger.debug(f"Resolved with suffix: '{query}' → '{resolved}'")
+                    logger.debug("Resolved with suffix: '%s' → '%s'", query, resolved)
                     return resolved
 
         # No resolution found — return original
@@ -184,7 +184,7 @@ class LawNameResolver:
                 if key not in self._aliases:
                     self._aliases[key] = full_name
                     learned += 1
-                    logger.debug(f"Learned alias: '{abbrev}' → '{full_name}'")
+                    logger.debug("Learned alias: '%s' → '%s'", abbrev, full_name)
 
             # Also learn the full name as self-alias (for exact match)
             full_key = full_name.lower()
@@ -192,7 +192,7 @@ class LawNameResolver:
                 self._aliases[full_key] = full_name
 
         if learned > 0:
-            logger.info(f"Learned {learned} new law aliases (total: {len(self._aliases)})")
+            logger.info("Learned %d new law aliases (total: %d)", learned, len(self._aliases))
         return learned
 
     def _correct_typos(self, text: str) -> str:
@@ -7,31 +7,30 @@ enabling AI agents to search and retrieve Korean legal information.
 All tools default to JSON format. XML and HTML are also supported.
 """
 
+import atexit
 import json
 import logging
 import os
 import re
+import threading
 from typing import Optional, Union
 
 from mcp.server.fastmcp import FastMCP, Context
 
+from .cache import get_cache
 from .client import LawAPIClient
 from .errors import ErrorCode, create_error_response
 from .params import map_params_to_upstream, resolve_oc
-from .validation import validate_date_range
+from .validation import validate_date_range, validate_pagination, validate_article_code, pad_article_code
 from .parser import parse_xml_response, extract_law_list, update_law_list
 from .ranking import detect_query_language, should_apply_ranking, rank_search_results
 from ._helpers import (
     TOOL_ANNOTATIONS, stringify_id, handle_tool_error,
-    slim_response, run_search, run_service,
+    slim_response, run_search, run_service, run_in_thread, run_coroutine,
     extract_outcome, extract_key_factors, extract_legal_terms, compute_text_diff,
 )
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the entry point (stdio_server / http_server main)
 logger = logging.getLogger(__name__)
 
 
@@ -182,12 +181,47 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
 
     server = FastMCP("LexLink - Korean Law API", instructions=SERVER_INSTRUCTIONS)
 
+    def tool(**kwargs):
+        """Like server.tool(), but sync tools run off the event loop.
+
+        FastMCP gets the threaded wrapper; the decorated name stays the plain
+        sync function so chain tools can keep calling other tools directly.
+        """
+        register = server.tool(**kwargs)
+
+        def decorator(func):
+            register(run_in_thread(func))
+            return func
+        return decorator
+
+    # Client settings come from the environment; read and coerce them once
+    # per server instead of on every tool call.
+    client_base_url = os.getenv("LEXLINK_BASE_URL", "http://www.law.go.kr")
+    client_timeout = int(os.getenv("LEXLINK_TIMEOUT", "60"))
+    # Same for the default OC; resolve_oc only re-reads the environment
+    # (and raises its error) when it was unset at startup
+    env_oc = os.getenv("OC", "").strip()
+
+    def _resolve_oc(override_oc: Optional[str]) -> str:
+        """resolve_oc() with the environment OC read once per server."""
+        if env_oc and not (override_oc and override_oc.strip()):
+            return env_oc
+        return resolve_oc(override_oc=override_oc)
+
+    # One pooled client per server: tool calls reuse its keep-alive
+    # connections instead of opening a new pool (and TCP connection) each time
+    shared_client: Optional[LawAPIClient] = None
+    client_lock = threading.Lock()  # tools may first call this from several threads
+
     def _get_client() -> LawAPIClient:
-        """Create HTTP client from environment variables or defaults."""
-        return LawAPIClient(
-            base_url=os.getenv("LEXLINK_BASE_URL", "http://www.law.go.kr"),
-            timeout=int(os.getenv("LEXLINK_TIMEOUT", "60")),
-        )
+        """Return the server's HTTP client, creating it on first use."""
+        nonlocal shared_client
+        if shared_client is None:
+            with client_lock:
+                if shared_client is None:
+                    shared_client = LawAPIClient(base_url=client_base_url, timeout=client_timeout)
+                    atexit.register(shared_client.close)
+        return shared_client
 
     # ==================== MCP Resources: Law ID Cache ====================
 
@@ -275,7 +309,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 1: eflaw_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def eflaw_search(
         query: str,
@@ -320,7 +354,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             ...     type="JSON"
             ... )
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         if ef_yd:
             validate_date_range(ef_yd, "ef_yd")
         snake_params = {
@@ -349,7 +383,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 2: law_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def law_search(
         query: str,
@@ -382,7 +416,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results with law list or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "law", "type": type,
             "query": query, "display": display, "page": page,
@@ -409,7 +443,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 3: eflaw_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def eflaw_service(
         id: Optional[Union[str, int]] = None,
@@ -451,10 +485,12 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Retrieve full law (WARNING: large response for some laws):
             >>> eflaw_service(id="1747", type="XML")
         """
-        (id, mst, jo) = stringify_id(id, mst, jo)
-        resolved_oc = resolve_oc(override_oc=oc)
+        (id, mst, jo) = stringify_id(id, mst, pad_article_code(jo))
+        resolved_oc = _resolve_oc(oc)
         if not id and not mst:
             raise ValueError("Either 'id' or 'mst' parameter is required")
+        if jo:
+            validate_article_code(jo, "jo")
         snake_params = {"oc": resolved_oc, "target": "eflaw", "type": type}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -465,7 +501,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 4: law_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def law_service(
         id: Optional[Union[str, int]] = None,
@@ -511,10 +547,12 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Retrieve full law (WARNING: large response for some laws):
             >>> law_service(id="009682", type="XML")
         """
-        (id, mst, jo) = stringify_id(id, mst, jo)
-        resolved_oc = resolve_oc(override_oc=oc)
+        (id, mst, jo) = stringify_id(id, mst, pad_article_code(jo))
+        resolved_oc = _resolve_oc(oc)
         if not id and not mst:
             raise ValueError("Either 'id' or 'mst' parameter is required")
+        if jo:
+            validate_article_code(jo, "jo")
         snake_params = {"oc": resolved_oc, "target": "law", "type": type}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -527,7 +565,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 5: eflaw_josub ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def eflaw_josub(
         id: Optional[Union[str, int]] = None,
@@ -570,10 +608,16 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Query 건축법 제3조 제1항:
             >>> eflaw_josub(mst="276925", jo="000300", hang="000100", type="XML")
         """
-        (id, mst, jo) = stringify_id(id, mst, jo)
-        resolved_oc = resolve_oc(override_oc=oc)
+        (id, mst, jo) = stringify_id(id, mst, pad_article_code(jo))
+        resolved_oc = _resolve_oc(oc)
         if not id and not mst:
             raise ValueError("Either 'id' or 'mst' parameter is required")
+        if jo:
+            validate_article_code(jo, "jo")
+        if hang:
+            validate_article_code(hang, "hang")
+        if ho:
+            validate_article_code(ho, "ho")
         snake_params = {"oc": resolved_oc, "target": "eflawjosub", "type": type}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -586,7 +630,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 6: law_josub ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def law_josub(
         id: Optional[Union[str, int]] = None,
@@ -627,10 +671,16 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Query 건축법 제3조 제1항:
             >>> law_josub(mst="276925", jo="000300", hang="000100", type="XML")
         """
-        (id, mst, jo) = stringify_id(id, mst, jo)
-        resolved_oc = resolve_oc(override_oc=oc)
+        (id, mst, jo) = stringify_id(id, mst, pad_article_code(jo))
+        resolved_oc = _resolve_oc(oc)
         if not id and not mst:
             raise ValueError("Either 'id' or 'mst' parameter is required")
+        if jo:
+            validate_article_code(jo, "jo")
+        if hang:
+            validate_article_code(hang, "hang")
+        if ho:
+            validate_article_code(ho, "ho")
         snake_params = {"oc": resolved_oc, "target": "lawjosub", "type": type}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -642,7 +692,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 7: elaw_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def elaw_search(
         query: str = "*",
@@ -684,7 +734,8 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search for "가정폭력방지":
             >>> elaw_search(query="가정폭력방지", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        validate_pagination(display, page)
+        resolved_oc = _resolve_oc(oc)
 
         # Validate date range if provided
         if ef_yd:
@@ -722,11 +773,17 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             # JSON format ignores numOfRows — must also set display
             if type == "JSON":
                 upstream_params["display"] = "100"
-            logger.debug(f"Ranking enabled: fetching 100 results instead of {original_display}")
+            logger.debug("Ranking enabled: fetching 100 results instead of %s", original_display)
 
-        # Call API
-        client = _get_client()
-        response = client.get("/DRF/lawSearch.do", upstream_params, response_type=type)
+        # Check cache before making API call
+        cache = get_cache()
+        cached = cache.get("elaw", upstream_params, type)
+        if cached is None:
+            client = _get_client()
+            cached = client.get("/DRF/lawSearch.do", upstream_params, response_type=type)
+            cache.put("elaw", upstream_params, type, cached)
+        # Annotate a copy: the cached dict is shared across concurrent calls
+        response = dict(cached)
 
         # Apply relevance ranking for English-translated laws
         # elaw target accepts both Korean and English queries, so detect language
@@ -760,7 +817,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                         # Trim to original requested display amount
                         if len(ranked_laws) > original_display:
                             ranked_laws = ranked_laws[:original_display]
-                            logger.debug(f"Trimmed results from {len(laws)} to {original_display}")
+                            logger.debug("Trimmed results from %d to %s", len(laws), original_display)
 
                         parsed_data = update_law_list(parsed_data, ranked_laws)
                         # Update numOfRows to reflect trimmed results
@@ -770,7 +827,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         return slim_response(response)
 
     # ==================== TOOL 8: elaw_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def elaw_service(
         id: Optional[Union[str, int]] = None,
@@ -811,7 +868,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         (id, mst) = stringify_id(id, mst)
         if not id and not mst:
             raise ValueError("Either 'id' or 'mst' parameter is required")
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {"oc": resolved_oc, "target": "elaw"}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -822,7 +879,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 9: admrul_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def admrul_search(
         query: str = "*",
@@ -872,7 +929,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search by date:
             >>> admrul_search(date=20250501, type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         if prml_yd:
             validate_date_range(prml_yd, "prml_yd")
         if mod_yd:
@@ -895,7 +952,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 10: admrul_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def admrul_service(
         id: Optional[Union[str, int]] = None,
@@ -932,7 +989,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         (id, lid) = stringify_id(id, lid)
         if not id and not lid and not lm:
             raise ValueError("At least one of 'id', 'lid', or 'lm' is required")
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {"oc": resolved_oc, "target": "admrul"}
         if id: snake_params["id"] = id
         if lid: snake_params["lid"] = lid
@@ -941,7 +998,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 11: lnkLs_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lnkLs_search(
         query: str = "*",
@@ -974,7 +1031,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search for "자동차관리법":
             >>> lnkLs_search(query="자동차관리법", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lnkLs", "query": query,
             "display": display, "page": page,
@@ -988,7 +1045,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 12: lnkLsOrdJo_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lnkLsOrdJo_search(
         query: str = "*",
@@ -1031,7 +1088,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search specific article (제20조):
             >>> lnkLsOrdJo_search(knd="002118", jo=20, type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lnkLsOrdJo", "query": query,
             "display": display, "page": page,
@@ -1049,7 +1106,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 13: lnkDep_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lnkDep_search(
         org: str,
@@ -1082,7 +1139,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search ordinances linked to ministry 1400000:
             >>> lnkDep_search(org="1400000", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lnkDep", "org": org,
             "display": display, "page": page,
@@ -1094,7 +1151,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 14: drlaw_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def drlaw_search(
         oc: Optional[str] = None,
@@ -1120,14 +1177,14 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Get linkage statistics:
             >>> drlaw_search()
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         params = {"oc": resolved_oc, "target": "drlaw"}
         upstream_params = map_params_to_upstream(params)
         client = _get_client()
         return client.get("/DRF/lawSearch.do", upstream_params, response_type="HTML")
 
     # ==================== TOOL 15: lsDelegated_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lsDelegated_service(
         id: Optional[Union[str, int]] = None,
@@ -1165,7 +1222,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         if type.upper() == "HTML":
             logger.warning("lsDelegated_service does not support HTML format, using XML")
             type = "XML"
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {"oc": resolved_oc, "target": "lsDelegated"}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -1175,7 +1232,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     # ==================== PHASE 3: CASE LAW & LEGAL RESEARCH ====================
 
     # ==================== TOOL 16: prec_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def prec_search(
         query: str = "*",
@@ -1229,7 +1286,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search Supreme Court precedents:
             >>> prec_search(query="담보권", curt="대법원")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "prec", "type": type,
             "query": query, "display": display, "page": page,
@@ -1255,7 +1312,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 17: prec_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def prec_service(
         id: Union[str, int],
@@ -1286,7 +1343,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> prec_service(id="228541")
             >>> prec_service(id="228541", sections="summary")  # PlayMCP-safe
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "prec",
             "id": str(id), "type": type,
@@ -1298,7 +1355,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           full_text_fields=["판례내용"])
 
     # ==================== TOOL 18: detc_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def detc_search(
         query: str = "*",
@@ -1344,7 +1401,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search by date:
             >>> detc_search(date=20150210)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "detc", "type": type,
             "query": query, "display": display, "page": page,
@@ -1366,7 +1423,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 19: detc_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def detc_service(
         id: Union[str, int],
@@ -1394,7 +1451,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> detc_service(id="58386")
             >>> detc_service(id="58386", sections="summary")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "detc",
             "id": str(id), "type": type,
@@ -1406,7 +1463,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           full_text_fields=["전문"])
 
     # ==================== TOOL 20: expc_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def expc_search(
         query: str = "*",
@@ -1458,7 +1515,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search by date range:
             >>> expc_search(query="자동차", expl_yd="20240101~20241231", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         if reg_yd:
             validate_date_range(reg_yd, "reg_yd")
         if expl_yd:
@@ -1484,7 +1541,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 17: expc_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def expc_service(
         id: Union[str, int],
@@ -1519,7 +1576,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Retrieve with name:
             >>> expc_service(id="315191", lm="여성가족부 - 건강가정기본법 제35조 제2항 관련", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "expc",
             "id": str(id), "type": type,
@@ -1531,7 +1588,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           full_text_fields=["이유"])
 
     # ==================== TOOL 18: decc_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def decc_search(
         query: str = "*",
@@ -1585,7 +1642,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search by date range:
             >>> decc_search(rsl_yd="20200101~20201231", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         if dpa_yd:
             validate_date_range(dpa_yd, "dpa_yd")
         if rsl_yd:
@@ -1610,7 +1667,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 19: decc_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def decc_service(
         id: Union[str, int],
@@ -1645,7 +1702,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Retrieve with case name:
             >>> decc_service(id="245011", lm="과징금 부과처분 취소청구", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "decc",
             "id": str(id), "type": type,
@@ -1659,7 +1716,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     # ==================== PHASE 4: ARTICLE CITATION ====================
 
     # ==================== TOOL 24: article_citation ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     async def article_citation(
         mst: str,
@@ -1726,8 +1783,8 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         # OC is not strictly required for citation extraction (uses HTML scraping)
         # but we validate it for consistency with other tools
         try:
-            resolved_oc = resolve_oc(override_oc=oc)
-            logger.debug(f"article_citation called with OC: {resolved_oc[:4]}...")
+            resolved_oc = _resolve_oc(oc)
+            logger.debug("article_citation called with OC: %s...", resolved_oc[:4])
         except ValueError:
             # OC not required for citation extraction
             logger.debug("article_citation called without OC (not required)")
@@ -1751,7 +1808,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         return result
 
     # ==================== TOOL 25: aiSearch ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def aiSearch(
         query: str,
@@ -1792,7 +1849,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> aiSearch(query="뺑소니 처벌", search=0)
             # Returns: 특정범죄 가중처벌 등에 관한 법률 제5조의3 (도주차량 운전자의 가중처벌)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "aiSearch", "type": type,
             "query": query, "search": search, "display": display, "page": page,
@@ -1803,7 +1860,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 26: aiRltLs_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def aiRltLs_search(
         query: str,
@@ -1837,7 +1894,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> aiRltLs_search(query="민법")
             # Returns: 상법 제54조 (상사법정이율), 의료법 제50조 (「민법」의 준용), etc.
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "aiRltLs", "type": type,
             "query": query, "search": search,
@@ -1850,7 +1907,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     # ==================== PHASE 7: EXTENDED LEGAL INFORMATION ====================
 
     # ==================== TOOL 27: ordin_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def ordin_search(
         query: str = "*",
@@ -1910,7 +1967,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search current ordinances:
             >>> ordin_search(query="주차장", display=20, type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         if ef_yd:
             validate_date_range(ef_yd, "ef_yd")
         if anc_yd:
@@ -1939,7 +1996,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 28: ordin_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def ordin_service(
         id: Optional[Union[str, int]] = None,
@@ -1973,7 +2030,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         (id, mst) = stringify_id(id, mst)
         if not id and not mst:
             raise ValueError("Either 'id' or 'mst' parameter is required")
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {"oc": resolved_oc, "target": "ordin", "type": type}
         if id: snake_params["id"] = id
         if mst: snake_params["mst"] = mst
@@ -1981,7 +2038,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 29: ordinLsCon_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def ordinLsCon_search(
         query: str = "*",
@@ -2013,7 +2070,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search for linked laws:
             >>> ordinLsCon_search(query="건축", type="XML")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "ordinLsCon", "type": type,
             "query": query, "display": display, "page": page,
@@ -2024,7 +2081,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 30: trty_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def trty_search(
         query: str = "*",
@@ -2072,7 +2129,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             Search multilateral treaties:
             >>> trty_search(cls=2, display=20)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         if eft_yd:
             validate_date_range(eft_yd, "eft_yd")
         if conc_yd:
@@ -2096,7 +2153,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 31: trty_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def trty_service(
         id: Union[str, int],
@@ -2124,7 +2181,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         """
         if not id:
             raise ValueError("'id' parameter is required")
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "trty", "type": type,
             "id": str(id),
@@ -2133,7 +2190,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
                           snake_params=snake_params, response_type=type)
 
     # ==================== TOOL 32: lstrm_ai_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lstrm_ai_search(
         query: str = "*",
@@ -2160,7 +2217,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lstrmAI", "type": type,
             "query": query, "display": display, "page": page,
@@ -2171,7 +2228,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 33: dlytrm_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def dlytrm_search(
         query: str = "*",
@@ -2198,7 +2255,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "dlytrm", "type": type,
             "query": query, "display": display, "page": page,
@@ -2209,7 +2266,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 34: lstrm_rlt_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lstrm_rlt_search(
         query: str = "*",
@@ -2237,7 +2294,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lstrmRlt", "type": type,
             "query": query, "display": display, "page": page,
@@ -2248,7 +2305,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 35: dlytrm_rlt_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def dlytrm_rlt_search(
         query: str = "*",
@@ -2276,7 +2333,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "dlytrmRlt", "type": type,
             "query": query, "display": display, "page": page,
@@ -2287,7 +2344,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 36: lstrm_rlt_jo_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def lstrm_rlt_jo_search(
         query: str = "*",
@@ -2314,7 +2371,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lstrmRltJo", "type": type,
             "query": query, "display": display, "page": page,
@@ -2325,7 +2382,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 37: jo_rlt_lstrm_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def jo_rlt_lstrm_search(
         query: str = "*",
@@ -2353,7 +2410,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "joRltLstrm", "type": type,
             "query": query, "display": display, "page": page,
@@ -2364,7 +2421,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 38: ls_rlt_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def ls_rlt_search(
         query: str = "*",
@@ -2392,7 +2449,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Search results or error
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": "lsRlt", "type": type,
             "query": query, "display": display, "page": page,
@@ -2421,7 +2478,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     }
 
     # ==================== TOOL 39: committee_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def committee_search(
         committee: str,
@@ -2468,7 +2525,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             valid = ", ".join(COMMITTEE_CODES.keys())
             raise ValueError(f"Invalid committee: '{committee}'. Valid values: {valid}")
 
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": target, "type": type,
             "query": query, "display": display, "page": page,
@@ -2485,7 +2542,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 40: committee_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def committee_service(
         committee: str,
@@ -2512,7 +2569,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             valid = ", ".join(COMMITTEE_CODES.keys())
             raise ValueError(f"Invalid committee: '{committee}'. Valid values: {valid}")
 
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": target,
             "id": str(id), "type": type,
@@ -2541,7 +2598,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     }
 
     # ==================== TOOL 41: cgm_expc_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def cgm_expc_search(
         ministry: str,
@@ -2593,7 +2650,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             raise ValueError(f"Invalid ministry: '{ministry}'. Valid values: {valid}")
 
         target = f"cgmExpc{code}"
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": target, "type": type,
             "query": query, "display": display, "page": page,
@@ -2610,7 +2667,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 42: cgm_expc_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def cgm_expc_service(
         ministry: str,
@@ -2638,7 +2695,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             raise ValueError(f"Invalid ministry: '{ministry}'. Valid values: {valid}")
 
         target = f"cgmExpc{code}"
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": target,
             "id": str(id), "type": type,
@@ -2657,7 +2714,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     }
 
     # ==================== TOOL 43: special_decc_search ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def special_decc_search(
         tribunal: str,
@@ -2711,7 +2768,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             raise ValueError(f"Invalid tribunal: '{tribunal}'. Valid values: {valid}")
 
         target = f"{code}SpecialDecc"
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": target, "type": type,
             "query": query, "display": display, "page": page,
@@ -2736,7 +2793,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         )
 
     # ==================== TOOL 44: special_decc_service ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def special_decc_service(
         tribunal: str,
@@ -2764,7 +2821,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             raise ValueError(f"Invalid tribunal: '{tribunal}'. Valid values: {valid}")
 
         target = f"{code}SpecialDecc"
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         snake_params = {
             "oc": resolved_oc, "target": target,
             "id": str(id), "type": type,
@@ -2775,7 +2832,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     # ==================== PHASE 8: PUBLIC LEGAL ASSISTANCE ====================
 
     # ==================== TOOL 45: check_precedent_odds ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def check_precedent_odds(
         query: str,
@@ -2805,7 +2862,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> check_precedent_odds(query="택배 파손 보상")
             >>> check_precedent_odds(query="부당해고", display=50, top_n=10)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
 
         # Step 1: Search precedents
         search_params = {
@@ -2911,7 +2968,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         }
 
     # ==================== TOOL 46: legal_resolver ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def legal_resolver(
         situation: str,
@@ -2940,7 +2997,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> legal_resolver(situation="집주인이 보증금을 안 돌려줘요")
             >>> legal_resolver(situation="회사에서 갑자기 해고당했어요", display=3)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         api_calls = 0
 
         # Step 1: AI search for relevant law articles
@@ -3031,10 +3088,10 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             if mst and top.get("article"):
                 try:
                     from .citation import extract_article_citations
-                    import asyncio
                     art_num = int(top["article"]) if top["article"].isdigit() else 0
                     if art_num > 0:
-                        cit_result = asyncio.get_event_loop().run_until_complete(
+                        # Runs on the server loop: the pooled citation client is bound to it
+                        cit_result = run_coroutine(
                             extract_article_citations(
                                 mst=mst, law_name=top["law_name"],
                                 article=art_num, article_branch=0,
@@ -3090,7 +3147,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         }
 
     # ==================== TOOL 47: simplify_article ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def simplify_article(
         law_name: str,
@@ -3120,7 +3177,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> simplify_article(law_name="민법", article=750)
             >>> simplify_article(law_name="건축법", article=37, article_branch=2)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
 
         # Step 1: Search for the law to get MST
         search_params = {
@@ -3284,7 +3341,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         }
 
     # ==================== TOOL 48: law_amendment_summary ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def law_amendment_summary(
         law_name: str,
@@ -3314,7 +3371,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> law_amendment_summary(law_name="근로기준법", date_from="20200101")
             >>> law_amendment_summary(law_name="민법", date_from="20150101", date_to="20251231")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
 
         # Search with announcement date range
         date_range = f"{date_from}~{date_to}"
@@ -3370,7 +3427,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         }
 
     # ==================== TOOL 49: article_amendment_diff ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def article_amendment_diff(
         mst_old: str,
@@ -3400,7 +3457,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Examples:
             >>> article_amendment_diff(mst_old="269000", mst_new="273000", article=52)
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         jo_str = f"{article:04d}{article_branch:02d}"
 
         # Fetch old version
@@ -3498,7 +3555,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
     # ==================== PHASE 9: CHAIN TOOLS & UTILITIES ====================
 
     # ==================== TOOL 50: chain_full_research ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def chain_full_research(
         query: str,
@@ -3551,7 +3608,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         return result
 
     # ==================== TOOL 51: chain_amendment_track ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def chain_amendment_track(
         law_name: str,
@@ -3620,7 +3677,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         return result
 
     # ==================== TOOL 52: chain_dispute_prep ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def chain_dispute_prep(
         query: str,
@@ -3648,7 +3705,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> chain_dispute_prep(query="부당해고")
             >>> chain_dispute_prep(query="개인정보 유출 과징금")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
         results = {}
 
         # 1. Court precedents
@@ -3741,7 +3798,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         }
 
     # ==================== TOOL 53: chain_law_system ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def chain_law_system(
         law_name: str,
@@ -3767,7 +3824,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
             >>> chain_law_system(law_name="건축법")
             >>> chain_law_system(law_name="개인정보 보호법")
         """
-        resolved_oc = resolve_oc(override_oc=oc)
+        resolved_oc = _resolve_oc(oc)
 
         # Step 1: Find the law
         search_params = {
@@ -3873,7 +3930,7 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         return result
 
     # ==================== TOOL 54: cache_stats ====================
-    @server.tool(annotations=TOOL_ANNOTATIONS)
+    @tool(annotations=TOOL_ANNOTATIONS)
     @handle_tool_error
     def cache_stats(ctx: Context = None) -> dict:
         """
@@ -3885,7 +3942,6 @@ For article_citation: you MUST first call eflaw_search to get the current MST (
         Returns:
             Cache statistics and resolver stats
         """
-        from .cache import get_cache
         from .resolver import get_resolver
 
         return {
@@ -1,11 +1,28 @@
 """Stdio transport entry point for LexLink MCP server."""
 
+import asyncio
+import logging
+
 from .server import create_server
 
 
+async def _run_stdio() -> None:
+    """Serve over stdio, then close the pooled citation HTTP client."""
+    try:
+        await create_server().run_stdio_async()
+    finally:
+        from .citation import close_extractor
+        await close_extractor()
+
+
 def main():
     """Run LexLink MCP server over stdio transport."""
-    create_server().run()
+    # Logs go to stderr; stdout carries the MCP protocol
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    asyncio.run(_run_stdio())
 
 
 if __name__ == "__main__":
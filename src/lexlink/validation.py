@@ -1,11 +1,22 @@
 """
 Parameter validation functions for law.go.kr API parameters.
 
-This module provides validation for date ranges to ensure they meet
-the API's format requirements before sending requests upstream.
+This module provides validation for date ranges, pagination and article
+codes to ensure they meet the API's format requirements before sending
+requests upstream.
 """
 
 import re
+from typing import Optional, Union
+
+# YYYYMMDD~YYYYMMDD date range (e.g., "20240101~20241231")
+_DATE_RANGE_RE = re.compile(r"([0-9]{8})~([0-9]{8})")
+
+# 6-digit article/paragraph/item code (e.g., "000300" = 제3조)
+_ARTICLE_CODE_RE = re.compile(r"[0-9]{6}")
+
+# law.go.kr caps display at 100 results per page
+MAX_DISPLAY = 100
 
 
 def validate_date_range(date_range: str, param_name: str) -> None:
@@ -27,26 +38,88 @@ def validate_date_range(date_range: str, param_name: str) -> None:
         >>> validate_date_range("2024-01-01~2024-12-31", "ef_yd")  # Invalid
         ValueError: ef_yd must be in format YYYYMMDD~YYYYMMDD, got: 2024-01-01~2024-12-31
     """
-    pattern = r"^\d{8}~\d{8}$"
-
-    if not re.match(pattern, date_range):
+    match = _DATE_RANGE_RE.fullmatch(date_range)
+    if not match:
         raise ValueError(
             f"{param_name} must be in format YYYYMMDD~YYYYMMDD "
             f"(e.g., '20240101~20241231'), got: {date_range}"
         )
 
     # Additional validation: check start <= end
-    start_str, end_str = date_range.split("~")
-    start_date = int(start_str)
-    end_date = int(end_str)
+    # (fixed-width digit strings compare the same as their integer values)
+    start_str, end_str = match.groups()
 
-    if start_date > end_date:
+    if start_str > end_str:
         raise ValueError(
             f"{param_name} start date must be <= end date, "
             f"got: {start_str} > {end_str}"
         )
 
 
+def validate_pagination(display: int, page: int = 1) -> None:
+    """
+    Validate search pagination (1 <= display <= 100, page >= 1).
+
+    Args:
+        display: Results per page
+        page: Page number (1-based)
+
+    Raises:
+        ValueError: If either value is out of range
+
+    Examples:
+        >>> validate_pagination(20, 1)  # Valid
+        >>> validate_pagination(200, 1)  # Invalid
+        ValueError: display must be between 1 and 100, got: 200
+    """
+    if not 1 <= display <= MAX_DISPLAY:
+        raise ValueError(f"display must be between 1 and {MAX_DISPLAY}, got: {display}")
+    if page < 1:
+        raise ValueError(f"page must be >= 1, got: {page}")
+
+
+def validate_article_code(code: str, param_name: str) -> None:
+    """
+    Validate a 6-digit article code (jo/hang/ho, XXXXXX format).
+
+    Args:
+        code: Article code string (e.g., "017400" for 제174조)
+        param_name: Parameter name for error message (e.g., "jo")
+
+    Raises:
+        ValueError: If code is not exactly 6 digits
+
+    Examples:
+        >>> validate_article_code("001502", "jo")  # Valid (제15조의2)
+        >>> validate_article_code("174", "jo")  # Invalid
+        ValueError: jo must be a 6-digit code (e.g., '017400' for 제174조), got: 174
+    """
+    if not _ARTICLE_CODE_RE.fullmatch(code):
+        raise ValueError(
+            f"{param_name} must be a 6-digit code "
+            f"(e.g., '017400' for 제174조), got: {code}"
+        )
+
+
+def pad_article_code(code: Optional[Union[str, int]]) -> Optional[Union[str, int]]:
+    """
+    Restore the leading zeros of an article code passed as an int.
+
+    LLMs may send jo=17400 for "017400" (제174조); the int has lost its
+    zero padding, so re-pad it to 6 digits. Strings and None are returned
+    unchanged.
+
+    Examples:
+        >>> pad_article_code(17400)
+        '017400'
+        >>> pad_article_code("017400")
+        '017400'
+    """
+    if isinstance(code, int):
+        return f"{code:06d}"
+    return code
+
+
 def format_article_number(article: int, branch: int = 0) -> str:
     """
     Format article number for law.go.kr API (XXXXXX format).
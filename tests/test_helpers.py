@@ -0,0 +1,81 @@
+"""Unit tests for the shared tool helpers (_helpers.py)."""
+
+import asyncio
+
+import pytest
+
+from lexlink import _helpers
+from lexlink.cache import ResponseCache
+
+FULL_XML = "<판례><사건명>손해배상</사건명><판례내용>전문 내용</판례내용></판례>"
+
+
+class FakeClient:
+    """Stands in for LawAPIClient; counts upstream calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, path, params, response_type):
+        self.calls += 1
+        return {"status": "ok", "raw_content": FULL_XML}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache()
+    monkeypatch.setattr(_helpers, "get_cache", lambda: cache)
+    return cache
+
+
+def _service(client, sections):
+    return _helpers.run_service(
+        get_client=lambda: client,
+        target="prec",
+        snake_params={"oc": "test", "target": "prec", "type": "XML", "id": "228541"},
+        response_type="XML",
+        sections=sections,
+        full_text_fields=["판례내용"],
+    )
+
+
+@pytest.mark.unit
+class TestRunServiceCache:
+    def test_summary_call_does_not_strip_cached_response(self, cache):
+        client = FakeClient()
+
+        summary = _service(client, "summary")
+        assert "전문 내용" not in summary["raw_content"]
+        assert summary["sections"] == "summary"
+
+        full = _service(client, "full")
+        assert client.calls == 1  # served from cache
+        assert full["raw_content"] == FULL_XML
+        assert "sections" not in full
+        assert "excluded_fields" not in full
+
+    def test_cache_hit_returns_a_copy(self, cache):
+        client = FakeClient()
+
+        first = _service(client, None)
+        first["raw_content"] = "changed by caller"
+
+        assert _service(client, None)["raw_content"] == FULL_XML
+        assert client.calls == 1
+
+
+async def _answer():
+    return 42
+
+
+@pytest.mark.unit
+class TestRunCoroutine:
+    def test_runs_without_a_server_loop(self):
+        assert _helpers.run_coroutine(_answer()) == 42
+
+    def test_refuses_to_block_the_running_loop(self):
+        async def call():
+            return _helpers.run_coroutine(_answer())
+
+        with pytest.raises(RuntimeError, match="would block the running event loop"):
+            asyncio.run(call())
@@ -0,0 +1,59 @@
+"""Tests for tools registered by create_server (server.py)."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from lexlink import citation
+from lexlink import server as server_module
+from lexlink.server import create_server
+
+
+def _fake_run_search(*, target, **kwargs):
+    """Canned search results for the legal_resolver chain."""
+    if target == "aiSearch":
+        return {"ranked_data": {"law": [{"법령명": "민법", "법령ID": "001706", "조문번호": "750"}]}}
+    if target == "eflaw":
+        return {"ranked_data": {"law": [{"법령일련번호": "265307"}]}}
+    return {"ranked_data": {}}
+
+
+@pytest.mark.unit
+class TestLegalResolverCitations:
+    def test_citations_run_on_server_loop_from_worker_thread(self, monkeypatch):
+        monkeypatch.setenv("OC", "test")
+        monkeypatch.setattr(server_module, "run_search", _fake_run_search)
+
+        seen = {}
+
+        async def fake_extract(mst, law_name, article, article_branch=0):
+            seen["loop"] = asyncio.get_running_loop()
+            seen["thread"] = threading.current_thread()
+            return {"citations": [{"target_law": "민법", "target_article": "3", "citation_type": "internal"}]}
+
+        monkeypatch.setattr(citation, "extract_article_citations", fake_extract)
+        server = create_server()
+
+        async def call():
+            result = await server.call_tool("legal_resolver", {"situation": "불법행위 손해배상"})
+            return asyncio.get_running_loop(), threading.current_thread(), result
+
+        loop, loop_thread, result = asyncio.run(call())
+
+        # The extractor ran on the server's loop (the tool body itself ran in a worker thread)
+        assert seen["loop"] is loop
+        assert seen["thread"] is loop_thread
+
+        content = result[0] if isinstance(result, tuple) else result
+        payload = json.loads(content[0].text)
+        assert payload["status"] == "ok"
+        assert payload["citations"] == [{
+            "from_law": "민법",
+            "from_article": "제750조",
+            "to_law": "민법",
+            "to_article": "제3조",
+            "type": "internal",
+        }]
+        assert payload["api_calls_made"] == 5
@@ -0,0 +1,109 @@
+"""Unit tests for law.go.kr parameter validation (validation.py)."""
+
+import pytest
+
+from lexlink.validation import (
+    MAX_DISPLAY,
+    pad_article_code,
+    validate_article_code,
+    validate_date_range,
+    validate_pagination,
+)
+
+
+@pytest.mark.unit
+class TestValidatePagination:
+    @pytest.mark.parametrize("display", [1, 20, MAX_DISPLAY])
+    def test_accepts_display_in_range(self, display):
+        validate_pagination(display, 1)
+
+    @pytest.mark.parametrize("display", [0, -1, MAX_DISPLAY + 1])
+    def test_rejects_display_out_of_range(self, display):
+        with pytest.raises(ValueError, match="display must be between 1 and 100"):
+            validate_pagination(display, 1)
+
+    def test_accepts_first_page(self):
+        validate_pagination(20, 1)
+
+    @pytest.mark.parametrize("page", [0, -3])
+    def test_rejects_page_below_one(self, page):
+        with pytest.raises(ValueError, match="page must be >= 1"):
+            validate_pagination(20, page)
+
+    def test_page_defaults_to_one(self):
+        validate_pagination(20)
+
+
+@pytest.mark.unit
+class TestValidateArticleCode:
+    @pytest.mark.parametrize("code", ["000300", "017400", "001502", "000000"])
+    def test_accepts_six_digit_codes(self, code):
+        validate_article_code(code, "jo")
+
+    @pytest.mark.parametrize(
+        "code", ["174", "17400", "0174000", "01740a", "0174 0", "017400\n", "", "０１７４００"]
+    )
+    def test_rejects_malformed_codes(self, code):
+        with pytest.raises(ValueError, match="jo must be a 6-digit code"):
+            validate_article_code(code, "jo")
+
+    def test_error_names_the_parameter(self):
+        with pytest.raises(ValueError, match="^hang must be"):
+            validate_article_code("1", "hang")
+
+
+@pytest.mark.unit
+class TestPadArticleCode:
+    def test_int_code_is_zero_padded(self):
+        # jo=17400 is "017400" (제174조) with its leading zero lost
+        assert pad_article_code(17400) == "017400"
+        assert pad_article_code(300) == "000300"
+
+    def test_str_code_is_unchanged(self):
+        assert pad_article_code("017400") == "017400"
+        assert pad_article_code("17400") == "17400"
+
+    def test_none_is_unchanged(self):
+        assert pad_article_code(None) is None
+
+    def test_int_and_str_codes_validate_alike(self):
+        validate_article_code(pad_article_code(17400), "jo")
+        validate_article_code(pad_article_code("017400"), "jo")
+        with pytest.raises(ValueError):
+            validate_article_code(pad_article_code("17400"), "jo")
+
+    def test_out_of_range_int_still_rejected(self):
+        with pytest.raises(ValueError):
+            validate_article_code(pad_article_code(1234567), "jo")
+        with pytest.raises(ValueError):
+            validate_article_code(pad_article_code(-1), "jo")
+
+
+@pytest.mark.unit
+class TestValidateDateRange:
+    @pytest.mark.parametrize(
+        "date_range", ["20240101~20241231", "20240101~20240101", "19991231~20000101"]
+    )
+    def test_accepts_ordered_ranges(self, date_range):
+        validate_date_range(date_range, "ef_yd")
+
+    @pytest.mark.parametrize(
+        "date_range",
+        [
+            "2024-01-01~2024-12-31",
+            "20240101-20241231",
+            "20240101~2024123",
+            "20240101",
+            "",
+            " 20240101~20241231",
+            "20240101~20241231\n",
+            "２０２４０１０１~２０２４１２３１",
+        ],
+    )
+    def test_rejects_malformed_ranges(self, date_range):
+        with pytest.raises(ValueError, match="ef_yd must be in format YYYYMMDD~YYYYMMDD"):
+            validate_date_range(date_range, "ef_yd")
+
+    def test_rejects_start_after_end(self):
+        with pytest.raises(ValueError, match="start date must be <= end date"):
+            validate_date_range("20241231~20240101", "ef_yd")